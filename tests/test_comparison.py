@@ -2,50 +2,50 @@ from typing import Iterable
 
 import pytest
 
-from versions.functions import parse_version
+from versions.functions import parse_version, sort_versions
 
 # NOTE: versions are ordered from smallest to largest
 
 
-@pytest.mark.parametrize(
-    "strings",
+STRINGS = (
     (
-        (
-            "1.0.0-alpha",
-            "1.0.0-alpha.1",
-            "1.0.0-beta",
-            "1.0.0-beta.1",
-            "1.0.0-rc.1",
-            "1.0.0-rc.1+build.1",
-            "1.0.0",
-            "1.0.0+build",
-            "1.0.0+build.1",
-            "1.0.0+1",
-            "1.2.0",
-            "1.2.3",
-            "1.3.0",
-            "2.0.0",
-            "2.2.0",
-        ),
-        (
-            "1.0.0-dev.0",
-            "1.0.0-alpha.0-dev.0",
-            "1.0.0-alpha.0",
-            "1.0.0-alpha.1-dev.0",
-            "1.0.0-beta.0-dev.0",
-            "1.0.0-beta.1",
-            "1.0.0-beta.1-post.0-dev.0",
-            "1.0.0-beta.1-post.0",
-            "1.0.0-rc.1",
-            "1.0.0",
-            "1.0.0+build.0",
-            "1.0.0+build.1",
-            "1.0.0-post.0-dev.0",
-            "1.0.0-post.0",
-            "1.1.1-dev.1",
-        ),
+        "1.0.0-alpha",
+        "1.0.0-alpha.1",
+        "1.0.0-beta",
+        "1.0.0-beta.1",
+        "1.0.0-rc.1",
+        "1.0.0-rc.1+build.1",
+        "1.0.0",
+        "1.0.0+build",
+        "1.0.0+build.1",
+        "1.0.0+1",
+        "1.2.0",
+        "1.2.3",
+        "1.3.0",
+        "2.0.0",
+        "2.2.0",
+    ),
+    (
+        "1.0.0-dev.0",
+        "1.0.0-alpha.0-dev.0",
+        "1.0.0-alpha.0",
+        "1.0.0-alpha.1-dev.0",
+        "1.0.0-beta.0-dev.0",
+        "1.0.0-beta.1",
+        "1.0.0-beta.1-post.0-dev.0",
+        "1.0.0-beta.1-post.0",
+        "1.0.0-rc.1",
+        "1.0.0",
+        "1.0.0+build.0",
+        "1.0.0+build.1",
+        "1.0.0-post.0-dev.0",
+        "1.0.0-post.0",
+        "1.1.1-dev.1",
     ),
 )
+
+
+@pytest.mark.parametrize("strings", STRINGS)
 def test_comparison(strings: Iterable[str]) -> None:
     versions = list(map(parse_version, strings))
 
@@ -57,3 +57,11 @@ def test_comparison(strings: Iterable[str]) -> None:
             assert (i >= j) is (v >= w)
             assert (i < j) is (v < w)
             assert (i > j) is (v > w)
+
+
+@pytest.mark.parametrize("strings", STRINGS)
+def test_sort_versions(strings: Iterable[str]) -> None:
+    versions = list(map(parse_version, strings))
+
+    assert sort_versions(reversed(versions)) == versions
+    assert sort_versions(versions, reverse=True) == versions[::-1]
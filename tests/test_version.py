@@ -1,3 +1,5 @@
+from pickle import dumps, loads
+
 import pytest
 
 from versions.segments import DevTag, Epoch, Local, PostTag, PreTag, Release
@@ -478,13 +480,48 @@ def test_normalize(v100candidate0rev0dev0: Version, v100rc0post0dev0: Version) -
     assert v100candidate0rev0dev0.normalize() == v100rc0post0dev0
 
 
+def test_normalize_normal(v100rc0post0dev0: Version) -> None:
+    assert v100rc0post0dev0.normalize() is v100rc0post0dev0
+
+
 V1E100A1POST1DEV1BUILD1 = "1!1.0.0-alpha.1-post.1-dev.1+build.1"
 V1E100A1POST1DEV1BUILD1_SHORT = "1!1.0.0a1.post1.dev1+build.1"
 
 
+def test_from_string_cached() -> None:
+    version = Version.from_string(V1E100A1POST1DEV1BUILD1)
+
+    assert Version.from_string(V1E100A1POST1DEV1BUILD1) is version
+
+    Version.clear_parse_cache()
+
+    assert Version.from_string(V1E100A1POST1DEV1BUILD1) == version
+
+
+def test_pickle(v1e100alpha1post1dev1build1: Version) -> None:
+    assert loads(dumps(v1e100alpha1post1dev1build1)) == v1e100alpha1post1dev1build1
+
+
 def test_to_string(v1e100alpha1post1dev1build1: Version) -> None:
     assert v1e100alpha1post1dev1build1.to_string() == V1E100A1POST1DEV1BUILD1
 
 
 def test_to_short_string(v1e100alpha1post1dev1build1: Version) -> None:
     assert v1e100alpha1post1dev1build1.to_short_string() == V1E100A1POST1DEV1BUILD1_SHORT
+
+
+@pytest.mark.parametrize(
+    "string",
+    (
+        "1.0.0",
+        "1!2.0.0",
+        "1.0.0-alpha.1",
+        "1.0.0-post.1-dev.0",
+        "1!1.0.0-rc.1-post.2-dev.3+build.1",
+    ),
+)
+def test_string_iterators_match_strings(string: str) -> None:
+    version = Version.from_string(string)
+
+    assert "".join(version.to_string_iterator()) == version.to_string()
+    assert "".join(version.to_short_string_iterator()) == version.to_short_string()
@@ -0,0 +1,235 @@
+from pickle import dumps, loads
+
+from versions.version import Version
+from versions.version_sets import EMPTY_SET, VersionPoint, VersionRange, VersionUnion
+
+
+def test_union_operations_cached() -> None:
+    version_union = VersionUnion.of(
+        VersionRange(max=Version.from_parts(1, 0), include_max=False),
+        VersionRange(min=Version.from_parts(2, 0), include_min=True),
+    )
+
+    version_range = VersionRange(
+        min=Version.from_parts(0, 5),
+        max=Version.from_parts(3, 0),
+        include_min=True,
+        include_max=False,
+    )
+
+    intersection = version_union.intersection(version_range)
+
+    assert intersection == VersionUnion.of(
+        VersionRange(
+            min=Version.from_parts(0, 5),
+            max=Version.from_parts(1, 0),
+            include_min=True,
+            include_max=False,
+        ),
+        VersionRange(
+            min=Version.from_parts(2, 0),
+            max=Version.from_parts(3, 0),
+            include_min=True,
+            include_max=False,
+        ),
+    )
+
+    assert version_union.intersection(version_range) is intersection
+
+    assert version_union.difference(version_range) is version_union.difference(version_range)
+
+
+def test_union_contains_and_intersects() -> None:
+    version_union = VersionUnion.of(
+        VersionRange(max=Version.from_parts(1, 0), include_max=False),
+        VersionRange(
+            min=Version.from_parts(2, 0),
+            max=Version.from_parts(3, 0),
+            include_min=True,
+            include_max=False,
+        ),
+        VersionRange(min=Version.from_parts(4, 0), include_min=False),
+    )
+
+    assert version_union.contains(Version.from_parts(0, 9))
+    assert not version_union.contains(Version.from_parts(1, 0))
+    assert version_union.contains(Version.from_parts(2, 0))
+    assert not version_union.contains(Version.from_parts(3, 0))
+    assert not version_union.contains(Version.from_parts(4, 0))
+    assert version_union.contains(Version.from_parts(5, 0))
+
+    assert (
+        VersionRange(
+            min=Version.from_parts(3, 0), max=Version.from_parts(4, 0), include_min=True
+        ).intersects(version_union)
+        is False
+    )
+
+    assert VersionRange(
+        min=Version.from_parts(2, 5), max=Version.from_parts(4, 5), include_min=True
+    ).intersects(version_union)
+
+    assert VersionRange().includes(version_union)
+    assert not VersionRange(max=Version.from_parts(4, 0)).includes(version_union)
+
+
+def test_operators() -> None:
+    version = Version.from_parts(1, 0)
+
+    version_point = VersionPoint(version)
+    version_range = VersionRange(max=version, include_max=False)
+
+    assert version in version_point
+    assert version not in version_range
+
+    assert version_range | version_point == VersionRange(max=version, include_max=True)
+    assert version_range & version_point == EMPTY_SET
+    assert version_point - version_point == EMPTY_SET
+    assert ~version_point == VersionUnion.of(
+        version_range, VersionRange(min=version, include_min=False)
+    )
+
+
+def test_symmetric_difference() -> None:
+    one = Version.from_parts(1, 0)
+    two = Version.from_parts(2, 0)
+    three = Version.from_parts(3, 0)
+
+    left = VersionRange(min=one, max=three, include_min=True, include_max=False)
+    right = VersionRange(min=two, include_min=True)
+
+    assert left ^ right == VersionUnion.of(
+        VersionRange(min=one, max=two, include_min=True, include_max=False),
+        VersionRange(min=three, include_min=True),
+    )
+
+    assert VersionPoint(one) ^ VersionPoint(one) == EMPTY_SET
+    assert VersionPoint(one) ^ VersionPoint(two) == VersionUnion.of(
+        VersionPoint(one), VersionPoint(two)
+    )
+
+
+def test_union_difference() -> None:
+    one = Version.from_parts(1, 0)
+    two = Version.from_parts(2, 0)
+    three = Version.from_parts(3, 0)
+    four = Version.from_parts(4, 0)
+    five = Version.from_parts(5, 0)
+
+    version_union = VersionUnion.of(
+        VersionRange(max=one, include_max=False),
+        VersionRange(min=two, max=three, include_min=True, include_max=False),
+        VersionRange(min=four, include_min=False),
+    )
+
+    assert version_union.difference(EMPTY_SET) == version_union
+
+    assert version_union.difference(
+        VersionRange(min=Version.from_parts(2, 5), max=five, include_min=True, include_max=True)
+    ) == VersionUnion.of(
+        VersionRange(max=one, include_max=False),
+        VersionRange(min=two, max=Version.from_parts(2, 5), include_min=True, include_max=False),
+        VersionRange(min=five, include_min=False),
+    )
+
+
+def test_union_same_and_apart() -> None:
+    version_union = VersionUnion.of(
+        VersionPoint(Version.from_parts(1, 0)), VersionPoint(Version.from_parts(2, 0))
+    )
+
+    other_union = VersionUnion.of(
+        VersionPoint(Version.from_parts(3, 0)), VersionPoint(Version.from_parts(4, 0))
+    )
+
+    assert version_union.intersection(version_union) is version_union
+    assert version_union.difference(version_union) == EMPTY_SET
+
+    assert version_union.intersection(other_union) == EMPTY_SET
+    assert version_union.difference(other_union) is version_union
+
+
+def test_union_operations_commutative_cache() -> None:
+    version_union = VersionUnion.of(
+        VersionPoint(Version.from_parts(1, 0)), VersionPoint(Version.from_parts(3, 0))
+    )
+
+    other_union = VersionUnion.of(
+        VersionPoint(Version.from_parts(2, 0)), VersionPoint(Version.from_parts(3, 0))
+    )
+
+    intersection = version_union.intersection(other_union)
+
+    assert intersection == VersionPoint(Version.from_parts(3, 0))
+    assert other_union.intersection(version_union) is intersection
+
+
+def test_range_difference_union() -> None:
+    one = Version.from_parts(1, 0)
+    two = Version.from_parts(2, 0)
+
+    version_range = VersionRange(min=one, max=two, include_min=True, include_max=True)
+
+    version_union = VersionUnion.of(
+        VersionRange(
+            min=Version.from_parts(0, 0),
+            max=Version.from_parts(3, 0),
+            include_min=True,
+            include_max=True,
+        ),
+        VersionPoint(Version.from_parts(5, 0)),
+    )
+
+    assert version_range.difference(version_union) == EMPTY_SET
+
+    assert VersionRange().difference(
+        VersionUnion.of(VersionPoint(one), VersionPoint(two))
+    ) == VersionUnion.of(
+        VersionRange(max=one, include_max=False),
+        VersionRange(min=one, max=two, include_min=False, include_max=False),
+        VersionRange(min=two, include_min=False),
+    )
+
+
+def test_union_sparse_operations() -> None:
+    points = [VersionPoint(Version.from_parts(major)) for major in range(10)]
+
+    version_union = VersionUnion.of(*points)
+
+    other_union = VersionUnion.of(points[2], points[7])
+
+    assert version_union.includes(other_union)
+    assert not other_union.includes(version_union)
+
+    assert version_union.intersects(other_union)
+    assert version_union.intersection(other_union) == other_union
+
+    assert not VersionUnion.of(
+        VersionPoint(Version.from_parts(2, 5)), VersionPoint(Version.from_parts(7, 5))
+    ).intersects(version_union)
+
+
+def test_union_complement_cached() -> None:
+    version = Version.from_parts(1, 0)
+
+    version_union = VersionUnion.of(
+        VersionRange(max=version, include_max=False), VersionRange(min=version, include_min=False)
+    )
+
+    complement = version_union.complement()
+
+    assert complement == VersionPoint(version)
+    assert version_union.complement() is complement
+
+
+def test_union_pickle_skips_operation_cache() -> None:
+    version_union = VersionUnion.of(
+        VersionPoint(Version.from_parts(1, 0)), VersionPoint(Version.from_parts(2, 0))
+    )
+
+    assert version_union.intersection(VersionRange()) == version_union
+
+    unpickled = loads(dumps(version_union))
+
+    assert unpickled == version_union
+    assert not unpickled.operation_cache
@@ -3,7 +3,7 @@ import pytest
 import versions
 from versions.functions import parse_version
 from versions.version import Version
-from versions.versioned import get_version, has_version
+from versions.versioned import get_version, get_versions, has_version
 
 
 @pytest.fixture()
@@ -20,6 +20,12 @@ def test_get_version_unchecked(version: Version) -> None:
         get_version(42)  # type: ignore
 
 
+def test_get_versions(version: Version) -> None:
+    assert get_versions([versions, versions]) == [version, version]
+
+    assert get_versions([versions, 42]) == [version]
+
+
 def test_has_version() -> None:
     assert has_version(versions)
     assert not has_version(69)
@@ -34,7 +34,7 @@ from versions.converters import (
     version_set_to_specifier,
 )
 from versions.errors import ParseError, ParseSpecificationError, ParseVersionError
-from versions.functions import parse_specifier, parse_version, parse_version_set
+from versions.functions import parse_specifier, parse_version, parse_version_set, sort_versions
 from versions.meta import python_version_info, version_info
 from versions.operators import Operator, OperatorType
 from versions.segments.epoch import Epoch
@@ -58,7 +58,7 @@ from versions.specifiers import (
     is_specifier_never,
     is_specifier_one,
 )
-from versions.version import Version
+from versions.version import Version, is_version
 from versions.version_sets import (
     EMPTY_SET,
     UNIVERSAL_SET,
@@ -75,11 +75,19 @@ from versions.version_sets import (
     is_version_set,
     is_version_union,
 )
-from versions.versioned import VERSION, Versioned, get_version, has_version, is_versioned
+from versions.versioned import (
+    VERSION,
+    Versioned,
+    get_version,
+    get_versions,
+    has_version,
+    is_versioned,
+)
 
 __all__ = (
     # versions
     "Version",
+    "is_version",
     # segments
     "Epoch",
     "Release",
@@ -139,6 +147,7 @@ __all__ = (
     "parse_specifier",
     "parse_version",
     "parse_version_set",
+    "sort_versions",
     # meta
     "version_info",
     "python_version_info",
@@ -146,6 +155,7 @@ __all__ = (
     "VERSION",
     "Versioned",
     "get_version",
+    "get_versions",
     "has_version",
     "is_versioned",
 )
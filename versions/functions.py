@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Type, TypeVar, overload
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, List, Type, TypeVar, overload
 
-from versions.parsers import SpecifierParser, VersionParser, VersionSetParser
+from versions.parsers import SpecifierParser, VersionParser, VersionSetParser, get_version_parser
 from versions.utils import cache
 from versions.version import Version
 
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
     from versions.specifiers import Specifier
     from versions.version_sets import VersionSet
 
-__all__ = ("parse_version", "parse_specifier", "parse_version_set")
+__all__ = ("parse_version", "parse_specifier", "parse_version_set", "sort_versions")
 
 V = TypeVar("V", bound=Version)
 
@@ -36,7 +37,9 @@ def parse_version(string: str, version_type: Type[Version] = Version) -> Version
     Returns:
         The newly parsed [`Version`][versions.version.Version].
     """
-    return VersionParser(version_type).parse(string)
+    parser: VersionParser[Version] = get_version_parser(version_type)
+
+    return parser.parse(string)
 
 
 @cache
@@ -50,7 +53,7 @@ def parse_specifier(string: str, version_type: Type[Version] = Version) -> Speci
     Returns:
         The newly parsed [`Specifier`][versions.specifiers.Specifier].
     """
-    return SpecifierParser(VersionParser(version_type)).parse(string)
+    return SpecifierParser(get_version_parser(version_type)).parse(string)
 
 
 @cache
@@ -64,4 +67,21 @@ def parse_version_set(string: str, version_type: Type[Version] = Version) -> Ver
     Returns:
         The newly parsed [`VersionSet`][versions.version_sets.VersionSet].
     """
-    return VersionSetParser(SpecifierParser(VersionParser(version_type))).parse(string)
+    return VersionSetParser(SpecifierParser(get_version_parser(version_type))).parse(string)
+
+
+get_sort_key = attrgetter("sort_key")
+
+
+def sort_versions(versions: Iterable[V], reverse: bool = False) -> List[V]:
+    """Sorts `versions`, comparing their [`sort_key`][versions.version.Version.sort_key]
+    directly instead of going through [`Version`][versions.version.Version] comparisons.
+
+    Arguments:
+        versions: The versions to sort.
+        reverse: Whether to sort in descending order.
+
+    Returns:
+        The sorted list of versions.
+    """
+    return sorted(versions, key=get_sort_key, reverse=reverse)
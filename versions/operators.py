@@ -221,7 +221,7 @@ def next_wildcard_breaking(version: V) -> Optional[V]:
     """
     index = version.last_index
 
-    if version.is_stable() and not version.is_post_release():
+    if version.stable and version.post is None:
         # the wildcard was used within the release segment
 
         if not index:
@@ -632,7 +632,7 @@ def translate_wildcard_equal(version: Version) -> VersionRange:
     wildcard = next_wildcard_breaking(version)
 
     if wildcard is None:
-        return VersionRange()
+        return UNIVERSAL_SET
 
     return VersionRange(min=version, max=wildcard, include_min=True, include_max=False)
 
@@ -984,6 +984,7 @@ class Operator(Representation, ToString):
 
 # simple import cycle solution
 from versions.version_sets import (
+    UNIVERSAL_SET,
     VersionEmpty,
     VersionPoint,
     VersionRange,
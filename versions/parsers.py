@@ -9,6 +9,7 @@ from typing import (
     Protocol,
     Type,
     TypeVar,
+    cast,
     runtime_checkable,
 )
 
@@ -22,16 +23,19 @@ from versions.errors import ParseSpecificationError, ParseTagError, ParseVersion
 from versions.operators import OperatorType
 from versions.patterns import (
     CARET_SPECIFICATION,
-    DEV,
+    DEV_PHASE,
+    DEV_VALUE,
     EPOCH,
     EQUAL_SPECIFICATION,
     LOCAL,
     OPERATOR_NAME,
     ORDER_SPECIFICATION,
     PHASE,
-    POST,
     POST_IMPLICIT,
-    PRE,
+    POST_PHASE,
+    POST_VALUE,
+    PRE_PHASE,
+    PRE_VALUE,
     RELEASE,
     TAG,
     TILDE_SPECIFICATION,
@@ -42,13 +46,23 @@ from versions.patterns import (
 )
 from versions.specifiers import Specifier, SpecifierAll, SpecifierAny, SpecifierOne
 from versions.string import clear_whitespace, split_comma, split_pipes
+from versions.utils import bounded_cache, cache
 from versions.version_sets import VersionSet
 
 if TYPE_CHECKING:
     from versions.segments.tags import Tag
     from versions.version import Version
 
-__all__ = ("Parser", "SpecifierParser", "TagParser", "VersionParser", "VersionSetParser")
+__all__ = (
+    "Parser",
+    "SpecifierParser",
+    "TagParser",
+    "VersionParser",
+    "VersionSetParser",
+    "get_version_parser",
+    "parse_version_cached",
+    "clear_version_cache",
+)
 
 V = TypeVar("V", bound="Version")
 T = TypeVar("T", bound="Tag")
@@ -60,6 +74,8 @@ CAN_NOT_PARSE = "can not parse `{}` to `{}`"
 
 @runtime_checkable
 class Parser(Protocol[R]):
+    __slots__ = ()
+
     @required
     def parse(self, string: str) -> R:
         raise NotImplementedError
@@ -107,26 +123,23 @@ class VersionParser(Parser[V]):
     def parse_release_optional(string: Optional[str]) -> Release:
         return Release() if string is None else Release.parse(string)
 
-    @staticmethod
-    def parse_pre_optional(string: Optional[str]) -> Optional[PreTag]:
-        return None if string is None else PreTag.parse(string)
-
-    @staticmethod
-    def parse_post_optional(string: Optional[str]) -> Optional[PostTag]:
-        return None if string is None else PostTag.parse(string)
-
     @staticmethod
     def parse_post_implicit_optional(string: Optional[str]) -> Optional[PostTag]:
         return None if string is None else PostTag.default_phase_with_value(int(string))
 
-    @staticmethod
-    def parse_dev_optional(string: Optional[str]) -> Optional[DevTag]:
-        return None if string is None else DevTag.parse(string)
-
     @staticmethod
     def parse_local_optional(string: Optional[str]) -> Optional[Local]:
         return None if string is None else Local.parse(string)
 
+    @staticmethod
+    def create_tag_optional(
+        tag_type: Type[T], phase: Optional[str], value: Optional[str]
+    ) -> Optional[T]:
+        if phase is None:
+            return None
+
+        return tag_type(phase) if value is None else tag_type(phase, int(value))
+
     def parse(self, string: str) -> V:
         match = VERSION.fullmatch(string)
 
@@ -135,19 +148,92 @@ class VersionParser(Parser[V]):
         if match is None:
             raise ParseVersionError(CAN_NOT_PARSE.format(string, get_name(version_type)))
 
+        (
+            epoch,
+            release,
+            pre_phase,
+            pre_value,
+            post_implicit,
+            post_phase,
+            post_value,
+            dev_phase,
+            dev_value,
+            local,
+        ) = match.group(
+            EPOCH,
+            RELEASE,
+            PRE_PHASE,
+            PRE_VALUE,
+            POST_IMPLICIT,
+            POST_PHASE,
+            POST_VALUE,
+            DEV_PHASE,
+            DEV_VALUE,
+            LOCAL,
+        )
+
+        create_tag_optional = self.create_tag_optional
+
         return version_type(
-            epoch=self.parse_epoch_optional(match.group(EPOCH)),
-            release=self.parse_release_optional(match.group(RELEASE)),
-            pre=self.parse_pre_optional(match.group(PRE)),
+            epoch=self.parse_epoch_optional(epoch),
+            release=self.parse_release_optional(release),
+            pre=create_tag_optional(PreTag, pre_phase, pre_value),
             post=(
-                self.parse_post_implicit_optional(match.group(POST_IMPLICIT))
-                or self.parse_post_optional(match.group(POST))
+                self.parse_post_implicit_optional(post_implicit)
+                or create_tag_optional(PostTag, post_phase, post_value)
             ),
-            dev=self.parse_dev_optional(match.group(DEV)),
-            local=self.parse_local_optional(match.group(LOCAL)),
+            dev=create_tag_optional(DevTag, dev_phase, dev_value),
+            local=self.parse_local_optional(local),
         )
 
 
+@cache
+def get_version_parser(version_type: Type[V]) -> VersionParser[V]:
+    """Returns the shared [`VersionParser`][versions.parsers.VersionParser] for `version_type`.
+
+    Arguments:
+        version_type: The version type to parse into.
+
+    Returns:
+        The version parser for the given type.
+    """
+    return VersionParser(version_type)
+
+
+VERSION_CACHE_SIZE = 4096
+"""The maximum count of parsed versions to keep around."""
+
+
+@bounded_cache(VERSION_CACHE_SIZE)
+def parse_version_cached_any(version_type: Type[Version], string: str) -> Version:
+    parser: VersionParser[Version] = get_version_parser(version_type)
+
+    return parser.parse(string)
+
+
+def parse_version_cached(version_type: Type[V], string: str) -> V:
+    """Parses a `string` into a version of `version_type`, reusing recently parsed versions.
+
+    Since versions are immutable, the same instance is returned for repeated strings.
+
+    Arguments:
+        version_type: The version type to parse into.
+        string: The string to parse.
+
+    Returns:
+        The parsed version.
+    """
+    # the cache is keyed on the version type, so the version is of `version_type`
+    return cast(V, parse_version_cached_any(version_type, string))
+
+
+def clear_version_cache() -> None:
+    """Clears the cache of parsed versions used by
+    [`parse_version_cached`][versions.parsers.parse_version_cached].
+    """
+    parse_version_cached_any.cache_clear()
+
+
 SPECIFICATION = "specification"
 
 OPERATOR_IS_NONE = "specification was matched but `operator` is `None`"
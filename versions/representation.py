@@ -10,6 +10,8 @@ TEMPLATE = "<{name} {string}>"
 
 
 class Representation:
+    __slots__ = ()
+
     WRAP: ClassVar[bool] = True
 
     def __repr__(self) -> str:
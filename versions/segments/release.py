@@ -364,7 +364,7 @@ class Release(Representation, String):
         Returns:
             Whether the part at the `index` is present.
         """
-        return self.precision > index
+        return len(self.parts) > index
 
     def pad_to(self, length: int, padding: int = DEFAULT_PADDING) -> Self:
         """Pads a [`Release`][versions.segments.release.Release] to the `length` with `padding`.
@@ -107,7 +107,10 @@ class Tag(Representation, String):
         Returns:
             The normalized tag.
         """
-        return self.set_phase(self.normal)
+        phase = self.phase
+        normal = self.normal
+
+        return self if phase == normal else self.set_phase(normal)
 
     def set_phase(self, phase: str) -> Self:
         """Sets the phase of the version tag.
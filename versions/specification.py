@@ -20,6 +20,8 @@ ACCEPTS = "accepts"
 class Specification(Protocol):
     """The specification protocol for defining version requirements."""
 
+    __slots__ = ()
+
     @required
     def accepts(self, version: Version) -> bool:
         """Checks if the `version` matches the specification.
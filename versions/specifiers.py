@@ -44,6 +44,8 @@ __all__ = (
 class Specifier(Representation, ToString, Specification):
     """Represents all possible specifiers."""
 
+    __slots__ = ()
+
 
 Specifiers = DynamicTuple[Specifier]
 
@@ -58,6 +58,8 @@ __all__ = (
 
 @runtime_checkable
 class FromString(Protocol):
+    __slots__ = ()
+
     @classmethod
     @required
     def from_string(cls, string: str) -> Self:
@@ -70,6 +72,8 @@ class FromString(Protocol):
 
 @runtime_checkable
 class ToString(Protocol):
+    __slots__ = ()
+
     @required
     def to_string(self) -> str:
         raise NotImplementedError
@@ -83,7 +87,7 @@ class ToString(Protocol):
 
 @runtime_checkable
 class String(FromString, ToString, Protocol):
-    pass
+    __slots__ = ()
 
 
 check_int = str.isdigit
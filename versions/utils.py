@@ -5,6 +5,7 @@ from iters.iters import iter
 
 __all__ = (
     "cache",
+    "bounded_cache",
     "first",
     "last",
     "set_last",
@@ -15,6 +16,7 @@ __all__ = (
 )
 
 cache = lru_cache(None)
+bounded_cache = lru_cache
 
 T = TypeVar("T")
 
@@ -1,23 +1,25 @@
-from typing import Iterator, Optional, Tuple, Union
+from functools import cached_property
+from typing import Any, Iterator, Optional, Tuple, Type, Union
 
-from attrs import evolve, field, frozen
-from typing_extensions import Self
+from attrs import field, frozen
+from typing_aliases import DynamicTuple, is_int
+from typing_extensions import Self, TypeGuard
 
-from versions.constants import DASH, DOT, EXCLAMATION, PLUS
-from versions.parsers import VersionParser
+from versions.constants import DASH, DOT, EMPTY, EXCLAMATION, PLUS
+from versions.parsers import clear_version_cache, parse_version_cached
 from versions.representation import Representation
-from versions.segments.constants import DEFAULT_PADDING, DEFAULT_VALUE
+from versions.segments.constants import DEFAULT_PADDING, DEFAULT_VALUE, MAJOR, MICRO, MINOR
 from versions.segments.epoch import Epoch
 from versions.segments.local import Local
 from versions.segments.release import Release
 from versions.segments.tags import DevTag, PostTag, PreTag
-from versions.segments.typing import Extra, LocalPart
+from versions.segments.typing import Extra, LocalPart, Parts
 
 from versions.specification import Specification
-from versions.string import String, concat_empty
+from versions.string import String
 from versions.types import AnyInfinity, Infinity, NegativeInfinity, infinity, negative_infinity
 
-__all__ = ("CompareKey", "Version")
+__all__ = ("CompareKey", "SortKey", "Version", "is_version")
 
 CompareEpoch = Epoch
 CompareRelease = Release
@@ -35,15 +37,40 @@ CompareKey = Tuple[
     CompareLocal,
 ]
 
+DEFAULT_EPOCH = Epoch()
+DEFAULT_RELEASE = Release()
 
-@frozen(repr=False, eq=True, order=True)
+COMPARE_NO_TAGS_AND_LOCAL = (infinity, negative_infinity, infinity, negative_infinity)
+
+SortRank = Tuple[int]
+SortTag = Tuple[int, str, int]
+SortAnyTag = Union[SortRank, SortTag]
+SortLocalPart = Tuple[int, LocalPart]
+SortLocal = DynamicTuple[SortLocalPart]
+
+SortKey = Tuple[int, Parts, SortAnyTag, SortAnyTag, SortAnyTag, SortLocal]
+
+SORT_NEGATIVE_INFINITY = (0,)
+SORT_INFINITY = (2,)
+
+SORT_TAG = 1
+
+SORT_LOCAL_STRING = 0
+SORT_LOCAL_INT = 1
+
+SORT_NO_LOCAL: SortLocal = ()
+
+StringParts = Tuple[str, str, str, str, str, str]
+
+
+@frozen(repr=False, eq=False, order=False)
 class Version(Representation, String):
     """Represents versions."""
 
-    epoch: Epoch = field(factory=Epoch, eq=False, order=False)
+    epoch: Epoch = field(default=DEFAULT_EPOCH, eq=False, order=False)
     """The *epoch* segment of the version."""
 
-    release: Release = field(factory=Release, eq=False, order=False)
+    release: Release = field(default=DEFAULT_RELEASE, eq=False, order=False)
     """The *release* segment of the version."""
 
     pre: Optional[PreTag] = field(default=None, eq=False, order=False)
@@ -58,131 +85,220 @@ class Version(Representation, String):
     local: Optional[Local] = field(default=None, eq=False, order=False)
     """The *local* segment of the version."""
 
-    compare_key: CompareKey = field(repr=False, init=False, eq=True, order=True, hash=False)
+    stable: bool = field(repr=False, init=False, eq=False, order=False)
+    """Whether the version is *stable*, that is, neither *pre-release* nor *dev-release*."""
 
-    @compare_key.default
-    def default_compare_key(self) -> CompareKey:
-        compare_epoch = self.epoch
-        compare_release = self.release
+    @stable.default
+    def default_stable(self) -> bool:
+        return self.pre is None and self.dev is None
 
-        compare_pre, compare_post, compare_dev = self.compute_compare_tags(
-            self.pre, self.post, self.dev
-        )
+    @cached_property
+    def compare_key(self) -> CompareKey:
+        """The key used to compare versions, computed on first access."""
+        pre = self.pre
+        post = self.post
+        dev = self.dev
+        local = self.local
+
+        if pre is None and post is None and dev is None and local is None:
+            return (self.epoch, self.release, *COMPARE_NO_TAGS_AND_LOCAL)
+
+        compare_pre: ComparePreTag
+
+        if pre is None:
+            compare_pre = negative_infinity if post is None and dev is not None else infinity
 
-        compare_local = self.compute_compare_local(self.local)
+        else:
+            compare_pre = pre
 
         return (
-            compare_epoch,
-            compare_release,
+            self.epoch,
+            self.release,
             compare_pre,
-            compare_post,
-            compare_dev,
-            compare_local,
+            negative_infinity if post is None else post,
+            infinity if dev is None else dev,
+            negative_infinity if local is None else local,
         )
 
-    @staticmethod
-    def compute_compare_tags(
-        pre: Optional[PreTag], post: Optional[PostTag], dev: Optional[DevTag]
-    ) -> Tuple[ComparePreTag, ComparePostTag, CompareDevTag]:
-        compare_pre: ComparePreTag
-        compare_post: ComparePostTag
-        compare_dev: CompareDevTag
+    @cached_property
+    def sort_key(self) -> SortKey:
+        """The key used to order versions, computed on first access.
 
-        if pre is None:
-            if post is None and dev is not None:
-                compare_pre = negative_infinity
+        Unlike [`compare_key`][versions.version.Version.compare_key], this key consists
+        of plain integers and strings only, which makes ordering comparisons cheaper.
+        """
+        pre = self.pre
+        post = self.post
+        dev = self.dev
+        local = self.local
+
+        sort_pre: SortAnyTag
+        sort_post: SortAnyTag
+        sort_dev: SortAnyTag
+        sort_local: SortLocal
 
-            else:
-                compare_pre = infinity
+        if pre is None:
+            sort_pre = SORT_NEGATIVE_INFINITY if post is None and dev is not None else SORT_INFINITY
 
         else:
-            compare_pre = pre
+            sort_pre = (SORT_TAG, pre.phase, pre.value)
 
-        compare_post = negative_infinity if post is None else post
-        compare_dev = infinity if dev is None else dev
+        sort_post = SORT_NEGATIVE_INFINITY if post is None else (SORT_TAG, post.phase, post.value)
+        sort_dev = SORT_INFINITY if dev is None else (SORT_TAG, dev.phase, dev.value)
 
-        return (compare_pre, compare_post, compare_dev)
+        if local is None:
+            sort_local = SORT_NO_LOCAL
 
-    @staticmethod
-    def compute_compare_local(local: Optional[Local]) -> CompareLocal:
-        return negative_infinity if local is None else local
+        else:
+            sort_local = tuple(
+                (SORT_LOCAL_INT, part) if is_int(part) else (SORT_LOCAL_STRING, part)
+                for part in local.parts
+            )
 
-    @classmethod
-    def from_string(cls, string: str) -> Self:
-        """Parses a [`Version`][versions.version.Version] from `string`.
+        return (
+            self.epoch.value,
+            self.release.compare_parts,
+            sort_pre,
+            sort_post,
+            sort_dev,
+            sort_local,
+        )
 
-        Arguments:
-            string: The string to parse.
+    def __reduce__(self) -> Tuple[Type[Self], Tuple[Any, ...]]:
+        return (
+            type(self),
+            (self.epoch, self.release, self.pre, self.post, self.dev, self.local),
+        )
 
-        Returns:
-            The parsed version.
-        """
-        return VersionParser(cls).parse(string)
+    @cached_property
+    def hash_value(self) -> int:
+        """The hash of the version, computed on first access."""
+        return hash(self.sort_key)
 
-    def to_string_iterator(self) -> Iterator[str]:
-        epoch = self.epoch
+    def __hash__(self) -> int:
+        return self.hash_value
 
-        if epoch:
-            yield epoch.to_string()
-            yield EXCLAMATION
+    def __eq__(self, other: object) -> bool:
+        if not is_version(other) or other.__class__ is not self.__class__:
+            return NotImplemented
 
-        yield self.release.to_string()
+        return self.compare_key == other.compare_key
 
-        pre = self.pre
+    def __ne__(self, other: object) -> bool:
+        if not is_version(other) or other.__class__ is not self.__class__:
+            return NotImplemented
 
-        if pre is not None:
-            yield DASH
-            yield pre.to_string()
+        return self.compare_key != other.compare_key
 
-        post = self.post
+    def __lt__(self, other: object) -> bool:
+        if not is_version(other) or other.__class__ is not self.__class__:
+            return NotImplemented
 
-        if post is not None:
-            yield DASH
-            yield post.to_string()
+        return self.sort_key < other.sort_key
 
-        dev = self.dev
+    def __le__(self, other: object) -> bool:
+        if not is_version(other) or other.__class__ is not self.__class__:
+            return NotImplemented
 
-        if dev is not None:
-            yield DASH
-            yield dev.to_string()
+        return self.sort_key <= other.sort_key
 
-        local = self.local
+    def __gt__(self, other: object) -> bool:
+        if not is_version(other) or other.__class__ is not self.__class__:
+            return NotImplemented
 
-        if local is not None:
-            yield PLUS
-            yield local.to_string()
+        return self.sort_key > other.sort_key
 
-    def to_short_string_iterator(self) -> Iterator[str]:
-        epoch = self.epoch
+    def __ge__(self, other: object) -> bool:
+        if not is_version(other) or other.__class__ is not self.__class__:
+            return NotImplemented
 
-        if epoch:
-            yield epoch.to_short_string()
-            yield EXCLAMATION
+        return self.sort_key >= other.sort_key
 
-        yield self.release.to_short_string()
+    @classmethod
+    def from_string(cls, string: str) -> Self:
+        """Parses a [`Version`][versions.version.Version] from `string`.
 
-        pre = self.pre
+        Arguments:
+            string: The string to parse.
 
-        if pre is not None:
-            yield pre.to_short_string()
+        Returns:
+            The parsed version.
+        """
+        return parse_version_cached(cls, string)
 
-        post = self.post
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Clears the cache of parsed versions used by
+        [`from_string`][versions.version.Version.from_string].
+        """
+        clear_version_cache()
+
+    def string_parts(self) -> StringParts:
+        epoch, release, pre, post, dev, local = (
+            self.epoch,
+            self.release,
+            self.pre,
+            self.post,
+            self.dev,
+            self.local,
+        )
 
-        if post is not None:
-            yield DOT
-            yield post.to_short_string()
+        return (
+            f"{epoch.to_string()}{EXCLAMATION}" if epoch else EMPTY,
+            release.to_string(),
+            EMPTY if pre is None else f"{DASH}{pre.to_string()}",
+            EMPTY if post is None else f"{DASH}{post.to_string()}",
+            EMPTY if dev is None else f"{DASH}{dev.to_string()}",
+            EMPTY if local is None else f"{PLUS}{local.to_string()}",
+        )
 
-        dev = self.dev
+    def short_string_parts(self) -> StringParts:
+        epoch, release, pre, post, dev, local = (
+            self.epoch,
+            self.release,
+            self.pre,
+            self.post,
+            self.dev,
+            self.local,
+        )
 
-        if dev is not None:
-            yield DOT
-            yield dev.to_short_string()
+        return (
+            f"{epoch.to_short_string()}{EXCLAMATION}" if epoch else EMPTY,
+            release.to_short_string(),
+            EMPTY if pre is None else pre.to_short_string(),
+            EMPTY if post is None else f"{DOT}{post.to_short_string()}",
+            EMPTY if dev is None else f"{DOT}{dev.to_short_string()}",
+            EMPTY if local is None else f"{PLUS}{local.to_short_string()}",
+        )
 
-        local = self.local
+    # both the iterators and the cached strings are built from the same segment parts
 
-        if local is not None:
-            yield PLUS
-            yield local.to_short_string()
+    def to_string_iterator(self) -> Iterator[str]:
+        for part in self.string_parts():
+            if part:
+                yield part
+
+    def to_short_string_iterator(self) -> Iterator[str]:
+        for part in self.short_string_parts():
+            if part:
+                yield part
+
+    @cached_property
+    def string(self) -> str:
+        """The string representation of the version, computed on first access."""
+        return EMPTY.join(self.string_parts())
+
+    @cached_property
+    def short_string(self) -> str:
+        """The *short* string representation of the version, computed on first access."""
+        return EMPTY.join(self.short_string_parts())
+
+    @cached_property
+    def pep440_string(self) -> str:
+        """The [*PEP 440*](https://peps.python.org/pep-0440) string representation
+        of the version, computed on first access.
+        """
+        return self.normalize().short_string
 
     def to_string(self) -> str:
         """Converts a [`Version`][versions.version.Version] to its string representation.
@@ -190,7 +306,7 @@ class Version(Representation, String):
         Returns:
             The version string.
         """
-        return concat_empty(self.to_string_iterator())
+        return self.string
 
     def to_short_string(self) -> str:
         """Converts a [`Version`][versions.version.Version] to its *short* string representation.
@@ -198,7 +314,7 @@ class Version(Representation, String):
         Returns:
             The *short* version string.
         """
-        return concat_empty(self.to_short_string_iterator())
+        return self.short_string
 
     def to_pep440_string(self) -> str:
         """Converts a [`Version`][versions.version.Version] to its
@@ -217,7 +333,7 @@ class Version(Representation, String):
         Returns:
             The [*PEP 440*](https://peps.python.org/pep-0440) version string.
         """
-        return self.normalize().to_short_string()
+        return self.pep440_string
 
     @property
     def precision(self) -> int:
@@ -300,16 +416,19 @@ class Version(Representation, String):
         Returns:
             The converted version.
         """
-        return evolve(self, release=self.release.to_semantic())
+        return self.set_release(self.release.to_semantic())
 
     def set_epoch(self, epoch: Epoch) -> Self:
-        return evolve(self, epoch=epoch)
+        return type(self)(epoch, self.release, self.pre, self.post, self.dev, self.local)
 
     def set_epoch_value(self, value: int) -> Self:
         return self.set_epoch(self.epoch.set_value(value))
 
     def set_release(self, release: Release) -> Self:
-        return evolve(self, release=release)
+        if release is self.release:
+            return self
+
+        return type(self)(self.epoch, release, self.pre, self.post, self.dev, self.local)
 
     def set_release_parts(self, *parts: int) -> Self:
         return self.set_release(self.release.set_parts(*parts))
@@ -402,10 +521,10 @@ class Version(Representation, String):
         """
         release = self.release
 
-        if self.is_stable():
+        if self.stable:
             release = release.next_major()
 
-        return self.without_tags_and_local().set_release(release)
+        return type(self)(self.epoch, release, None, None, None, None)
 
     def next_minor(self) -> Self:
         """Bumps the *minor* part of the [`Release`][versions.segments.Release]
@@ -416,10 +535,10 @@ class Version(Representation, String):
         """
         release = self.release
 
-        if self.is_stable():
+        if self.stable:
             release = release.next_minor()
 
-        return self.without_tags_and_local().set_release(release)
+        return type(self)(self.epoch, release, None, None, None, None)
 
     def next_micro(self) -> Self:
         """Bumps the *micro* part of the [`Release`][versions.segments.Release]
@@ -430,10 +549,10 @@ class Version(Representation, String):
         """
         release = self.release
 
-        if self.is_stable():
+        if self.stable:
             release = release.next_micro()
 
-        return self.without_tags_and_local().set_release(release)
+        return type(self)(self.epoch, release, None, None, None, None)
 
     def next_patch(self) -> Self:
         """Bumps the *patch* part of the [`Release`][versions.segments.Release]
@@ -446,10 +565,10 @@ class Version(Representation, String):
         """
         release = self.release
 
-        if self.is_stable():
+        if self.stable:
             release = release.next_patch()
 
-        return self.without_tags_and_local().set_release(release)
+        return type(self)(self.epoch, release, None, None, None, None)
 
     def next_at(self, index: int) -> Self:
         """Bumps the part of the [`Release`][versions.segments.Release] at the `index`
@@ -463,10 +582,10 @@ class Version(Representation, String):
         """
         release = self.release
 
-        if self.is_stable():
+        if self.stable:
             release = release.next_at(index)
 
-        return self.without_tags_and_local().set_release(release)
+        return type(self)(self.epoch, release, None, None, None, None)
 
     def has_major(self) -> bool:
         """Checks if the [`Release`][versions.segments.Release] has the *major* part.
@@ -516,7 +635,7 @@ class Version(Representation, String):
         Returns:
             Whether the part at the `index` is present.
         """
-        return self.release.has_at(index)
+        return len(self.release.parts) > index
 
     def pad_to(self, length: int, padding: int = DEFAULT_PADDING) -> Self:
         """Pads the [`Release`][versions.segments.Release] to the `length` with `padding`.
@@ -591,7 +710,7 @@ class Version(Representation, String):
         Returns:
             Whether the version is *unstable*.
         """
-        return self.is_pre_release() or self.is_dev_release()
+        return not self.stable
 
     def is_stable(self) -> bool:
         """Checks if the version is *stable*.
@@ -599,7 +718,7 @@ class Version(Representation, String):
         Returns:
             Whether the version is *stable*.
         """
-        return not self.is_unstable()
+        return self.stable
 
     def next_pre(self) -> Self:
         """Bumps the [`PreTag`][versions.segments.PreTag] if it is present,
@@ -616,7 +735,7 @@ class Version(Representation, String):
         else:
             pre = pre.next()
 
-        return self.without_tags_and_local().with_pre(pre)
+        return self.set_tags_and_local(pre, None, None, None)
 
     def next_pre_phase(self) -> Optional[Self]:
         """Bumps the [`PreTag`][versions.segments.PreTag] phase if it is present (and if possible),
@@ -636,7 +755,7 @@ class Version(Representation, String):
             if pre is None:
                 return None
 
-        return self.without_tags_and_local().with_pre(pre)
+        return self.set_tags_and_local(pre, None, None, None)
 
     def next_post(self) -> Self:
         """Bumps the [`PostTag`][versions.segments.PostTag] if it is present,
@@ -653,7 +772,7 @@ class Version(Representation, String):
         else:
             post = post.next()
 
-        return self.with_post(post).without_dev_and_local()
+        return type(self)(self.epoch, self.release, self.pre, post, None, None)
 
     def next_dev(self) -> Self:
         """Bumps the [`DevTag`][versions.segments.DevTag] if it is present,
@@ -670,24 +789,24 @@ class Version(Representation, String):
         else:
             dev = dev.next()
 
-        return self.with_dev(dev).without_local()
+        return self.set_dev_and_local(dev, None)
 
     def set_pre(self, pre: Optional[PreTag]) -> Self:
-        return evolve(self, pre=pre)
+        return type(self)(self.epoch, self.release, pre, self.post, self.dev, self.local)
 
     def set_post(self, post: Optional[PostTag]) -> Self:
-        return evolve(self, post=post)
+        return type(self)(self.epoch, self.release, self.pre, post, self.dev, self.local)
 
     def set_dev(self, dev: Optional[DevTag]) -> Self:
-        return evolve(self, dev=dev)
+        return type(self)(self.epoch, self.release, self.pre, self.post, dev, self.local)
 
     def set_tags(
         self, pre: Optional[PreTag], post: Optional[PostTag], dev: Optional[DevTag]
     ) -> Self:
-        return evolve(self, pre=pre, post=post, dev=dev)
+        return type(self)(self.epoch, self.release, pre, post, dev, self.local)
 
     def set_local(self, local: Optional[Local]) -> Self:
-        return evolve(self, local=local)
+        return type(self)(self.epoch, self.release, self.pre, self.post, self.dev, local)
 
     def set_local_parts(self, *parts: LocalPart) -> Self:
         local = self.local
@@ -697,7 +816,7 @@ class Version(Representation, String):
         return self.set_local(local)
 
     def set_dev_and_local(self, dev: Optional[DevTag], local: Optional[Local]) -> Self:
-        return evolve(self, dev=dev, local=local)
+        return type(self)(self.epoch, self.release, self.pre, self.post, dev, local)
 
     def set_tags_and_local(
         self,
@@ -706,7 +825,7 @@ class Version(Representation, String):
         dev: Optional[DevTag],
         local: Optional[Local],
     ) -> Self:
-        return evolve(self, pre=pre, post=post, dev=dev, local=local)
+        return type(self)(self.epoch, self.release, pre, post, dev, local)
 
     def with_pre(self, pre: PreTag) -> Self:
         """Updates a version to include [`PreTag`][versions.segments.PreTag].
@@ -767,7 +886,7 @@ class Version(Representation, String):
         Returns:
             The updated version.
         """
-        return self.set_pre(None)
+        return self if self.pre is None else self.set_pre(None)
 
     def without_post(self) -> Self:
         """Updates a version, removing any [`PostTag`][versions.segments.PostTag] from it.
@@ -775,7 +894,7 @@ class Version(Representation, String):
         Returns:
             The updated version.
         """
-        return self.set_post(None)
+        return self if self.post is None else self.set_post(None)
 
     def without_dev(self) -> Self:
         """Updates a version, removing any [`DevTag`][versions.segments.DevTag] from it.
@@ -783,9 +902,12 @@ class Version(Representation, String):
         Returns:
             The updated version.
         """
-        return self.set_dev(None)
+        return self if self.dev is None else self.set_dev(None)
 
     def without_tags(self) -> Self:
+        if self.pre is None and self.post is None and self.dev is None:
+            return self
+
         return self.set_tags(None, None, None)
 
     def without_local(self) -> Self:
@@ -794,12 +916,18 @@ class Version(Representation, String):
         Returns:
             The updated version.
         """
-        return self.set_local(None)
+        return self if self.local is None else self.set_local(None)
 
     def without_dev_and_local(self) -> Self:
+        if self.dev is None and self.local is None:
+            return self
+
         return self.set_dev_and_local(None, None)
 
     def without_tags_and_local(self) -> Self:
+        if self.pre is None and self.post is None and self.dev is None and self.local is None:
+            return self
+
         return self.set_tags_and_local(None, None, None, None)
 
     def weaken(self, other: Self) -> Self:
@@ -811,11 +939,21 @@ class Version(Representation, String):
         Returns:
             The weakened version.
         """
-        if not self.is_local() and other.is_local():
-            other = other.without_local()
-
-        if not self.is_post_release() and other.is_post_release():
-            other = other.without_post()
+        local = other.local
+        post = other.post
+
+        drop_local = local is not None and self.local is None
+        drop_post = post is not None and self.post is None
+
+        if drop_local or drop_post:
+            return type(other)(
+                other.epoch,
+                other.release,
+                other.pre,
+                None if drop_post else post,
+                other.dev,
+                None if drop_local else local,
+            )
 
         return other
 
@@ -825,7 +963,7 @@ class Version(Representation, String):
         Returns:
             The stable version.
         """
-        return self if self.is_stable() else self.to_stable_unchecked()
+        return self if self.stable else self.to_stable_unchecked()
 
     def to_stable_unchecked(self) -> Self:
         """Forces a version to be stable, without checking whether it is already stable.
@@ -854,19 +992,20 @@ class Version(Representation, String):
         Returns:
             The next breaking [`Version`][versions.version.Version].
         """
-        if not self.major:
-            if self.minor:
-                return self.next_minor()
+        parts = self.release.parts
+
+        if not parts[MAJOR]:
+            precision = len(parts)
 
-            if self.has_micro():
-                return self.next_micro()
+            if precision > MICRO:
+                return self.next_minor() if parts[MINOR] else self.next_micro()
 
-            if self.has_minor():
+            if precision > MINOR:
                 return self.next_minor()
 
             return self.next_major()
 
-        return self.to_stable().next_major()
+        return type(self)(self.epoch, self.release.next_major(), None, None, None, None)
 
     def normalize(self) -> Self:
         """Normalizes all version tags.
@@ -875,21 +1014,20 @@ class Version(Representation, String):
             The normalized version.
         """
         pre = self.pre
-
-        if pre is not None:
-            pre = pre.normalize()
-
         post = self.post
+        dev = self.dev
 
-        if post is not None:
-            post = post.normalize()
+        if pre is None and post is None and dev is None:
+            return self
 
-        dev = self.dev
+        normal_pre = None if pre is None else pre.normalize()
+        normal_post = None if post is None else post.normalize()
+        normal_dev = None if dev is None else dev.normalize()
 
-        if dev is not None:
-            dev = dev.normalize()
+        if normal_pre is pre and normal_post is post and normal_dev is dev:
+            return self
 
-        return self.set_tags(pre, post, dev)
+        return self.set_tags(normal_pre, normal_post, normal_dev)
 
     @classmethod
     def create(
@@ -915,14 +1053,14 @@ class Version(Representation, String):
         Returns:
             The newly created [`Version`][versions.version.Version].
         """
-
-        if epoch is None:
-            epoch = Epoch()
-
-        if release is None:
-            release = Release()
-
-        return cls(epoch, release, pre, post, dev, local)
+        return cls(
+            DEFAULT_EPOCH if epoch is None else epoch,
+            DEFAULT_RELEASE if release is None else release,
+            pre,
+            post,
+            dev,
+            local,
+        )
 
     @classmethod
     def from_parts(
@@ -948,9 +1086,7 @@ class Version(Representation, String):
         Returns:
             The newly created [`Version`][versions.version.Version].
         """
-        release = Release(parts)
-
-        return cls.create(epoch, release, pre, post, dev, local)
+        return cls(DEFAULT_EPOCH if epoch is None else epoch, Release(parts), pre, post, dev, local)
 
     def matches(self, specification: Specification) -> bool:
         """Checks if a version matches the `specification`.
@@ -962,3 +1098,12 @@ class Version(Representation, String):
             Whether the version matches the specification.
         """
         return specification.accepts(self)
+
+
+def is_version(item: Any) -> TypeGuard[Version]:
+    """Checks if an `item` is an instance of [`Version`][versions.version.Version].
+
+    Returns:
+        Whether the `item` provided is an instance of [`Version`][versions.version.Version].
+    """
+    return isinstance(item, Version)
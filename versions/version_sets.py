@@ -1,24 +1,32 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from heapq import merge as merge_sorted
+from math import inf
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
     Iterable,
     Iterator,
     List,
     Literal,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     runtime_checkable,
 )
+from weakref import ref
 
-from attrs import Attribute, define, evolve, field, frozen
+from attrs import Attribute, define, field, frozen
 from orderings import Ordering
-from typing_aliases import DynamicTuple, is_instance, required
+from typing_aliases import DynamicTuple, required
 from typing_extensions import Self, TypeGuard
 
 from versions.constants import EMPTY_VERSION, UNIVERSE_VERSION
@@ -34,7 +42,7 @@ from versions.string import (
     concat_pipes_spaced,
 )
 from versions.types import Infinity, NegativeInfinity, infinity, negative_infinity
-from versions.utils import contains_only_item, first, flatten, last, next_or_none, set_last
+from versions.utils import contains_only_item
 
 if TYPE_CHECKING:
     from versions.version import Version
@@ -57,6 +65,8 @@ __all__ = (
 
 @runtime_checkable
 class VersionSetProtocol(Specification, Protocol):
+    __slots__ = ()
+
     @required
     def is_empty(self) -> bool:
         """Checks if the set is *empty*.
@@ -272,6 +282,17 @@ class VersionSetProtocol(Specification, Protocol):
         """
         return self.complement()
 
+    def __invert__(self) -> VersionSet:
+        """Computes the *complement* of `self` via the *invert* (`~`) operation.
+
+        This is equivalent to [`self.complement()`]
+        [versions.version_sets.VersionSetProtocol.complement].
+
+        Returns:
+            The set representing the *complement* of `self`.
+        """
+        return self.complement()
+
 
 def is_version_empty(item: Any) -> TypeGuard[VersionEmpty]:
     """Checks if an `item` is an instance of [`VersionEmpty`][versions.version_sets.VersionEmpty].
@@ -280,7 +301,7 @@ def is_version_empty(item: Any) -> TypeGuard[VersionEmpty]:
         Whether the `item` provided is an instance
             of [`VersionEmpty`][versions.version_sets.VersionEmpty].
     """
-    return is_instance(item, VersionEmpty)
+    return isinstance(item, VersionEmpty)
 
 
 def is_version_point(item: Any) -> TypeGuard[VersionPoint]:
@@ -290,7 +311,7 @@ def is_version_point(item: Any) -> TypeGuard[VersionPoint]:
         Whether the `item` provided is an instance
             of [`VersionPoint`][versions.version_sets.VersionPoint].
     """
-    return is_instance(item, VersionPoint)
+    return isinstance(item, VersionPoint)
 
 
 def is_version_range(item: Any) -> TypeGuard[VersionRange]:
@@ -300,7 +321,7 @@ def is_version_range(item: Any) -> TypeGuard[VersionRange]:
         Whether the `item` provided is an instance
             of [`VersionRange`][versions.version_sets.VersionRange].
     """
-    return is_instance(item, VersionRange)
+    return isinstance(item, VersionRange)
 
 
 def is_version_union(item: Any) -> TypeGuard[VersionUnion]:
@@ -310,7 +331,7 @@ def is_version_union(item: Any) -> TypeGuard[VersionUnion]:
         Whether the `item` provided is an instance
             of [`VersionUnion`][versions.version_sets.VersionUnion].
     """
-    return is_instance(item, VersionUnion)
+    return isinstance(item, VersionUnion)
 
 
 def is_version_item(item: Any) -> TypeGuard[VersionItem]:
@@ -320,7 +341,7 @@ def is_version_item(item: Any) -> TypeGuard[VersionItem]:
         Whether the `item` provided is an instance
             of [`VersionItem`][versions.version_sets.VersionItem].
     """
-    return is_instance(item, VersionItemTypes)
+    return isinstance(item, VersionItemTypes)
 
 
 def is_version_set(item: Any) -> TypeGuard[VersionSet]:
@@ -330,7 +351,7 @@ def is_version_set(item: Any) -> TypeGuard[VersionSet]:
         Whether the `item` provided is an instance
             of [`VersionSet`][versions.version_sets.VersionSet].
     """
-    return is_instance(item, VersionSetTypes)
+    return isinstance(item, VersionSetTypes)
 
 
 E = TypeVar("E", bound="VersionEmpty")
@@ -374,6 +395,16 @@ class VersionEmpty(Representation, ToString, VersionSetProtocol):
     def to_string(self) -> str:
         return EMPTY_VERSION
 
+    # operators call the implementations directly
+
+    __contains__ = contains
+
+    __and__ = __iand__ = intersection
+    __or__ = __ior__ = union
+    __sub__ = __isub__ = difference
+    __xor__ = __ixor__ = symmetric_difference
+    __negate__ = __invert__ = complement
+
 
 EMPTY_SET = VersionEmpty()
 
@@ -383,6 +414,21 @@ UNEXPECTED_VERSION_SET = "unexpected version set provided: {}"
 CAN_NOT_INCLUDE_INFINITY = "ranges can not contain infinities"
 
 
+# bound keys pair sort keys of bounds with their inclusion, so that `[v` < `(v` and `v)` < `v]`
+
+INCLUDED_MIN = 0
+EXCLUDED_MIN = 1
+
+EXCLUDED_MAX = 0
+INCLUDED_MAX = 1
+
+# sort keys of versions start with the epoch value, so these are below and above any of them
+NEGATIVE_INFINITY_SORT_KEY = (-inf,)
+INFINITY_SORT_KEY = (inf,)
+
+BoundKey = Tuple[Tuple[Any, ...], int]
+
+
 def unexpected_version_set(item: Any) -> TypeError:
     return TypeError(UNEXPECTED_VERSION_SET.format(item))
 
@@ -396,6 +442,57 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
     include_min: bool = False
     include_max: bool = False
 
+    comparable_min: Union[Version, NegativeInfinity] = field(init=False, eq=False)
+    comparable_max: Union[Version, Infinity] = field(init=False, eq=False)
+
+    min_key: BoundKey = field(init=False, eq=False)
+    max_key: BoundKey = field(init=False, eq=False)
+
+    empty: bool = field(init=False, eq=False)
+    point: bool = field(init=False, eq=False)
+
+    hash_value: int = field(init=False, eq=False)
+
+    @comparable_min.default
+    def default_comparable_min(self) -> Union[Version, NegativeInfinity]:
+        min = self.min
+
+        return negative_infinity if min is None else min
+
+    @comparable_max.default
+    def default_comparable_max(self) -> Union[Version, Infinity]:
+        max = self.max
+
+        return infinity if max is None else max
+
+    @min_key.default
+    def default_min_key(self) -> BoundKey:
+        min = self.min
+
+        sort_key = NEGATIVE_INFINITY_SORT_KEY if min is None else min.sort_key
+
+        return (sort_key, INCLUDED_MIN if self.include_min else EXCLUDED_MIN)
+
+    @max_key.default
+    def default_max_key(self) -> BoundKey:
+        max = self.max
+
+        sort_key = INFINITY_SORT_KEY if max is None else max.sort_key
+
+        return (sort_key, INCLUDED_MAX if self.include_max else EXCLUDED_MAX)
+
+    @empty.default
+    def default_empty(self) -> bool:
+        return self.is_empty_or_point() and not self.is_closed()
+
+    @point.default
+    def default_point(self) -> bool:
+        return self.is_empty_or_point() and self.is_closed()
+
+    @hash_value.default
+    def default_hash_value(self) -> int:
+        return hash(self.parameters)
+
     def __attrs_post_init__(self) -> None:
         if self.min is None and self.include_min:
             raise ValueError(CAN_NOT_INCLUDE_INFINITY)
@@ -420,20 +517,8 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
     def exclude_max(self) -> bool:
         return not self.include_max
 
-    @property
-    def comparable_min(self) -> Union[Version, NegativeInfinity]:
-        min = self.min
-
-        return negative_infinity if min is None else min
-
-    @property
-    def comparable_max(self) -> Union[Version, Infinity]:
-        max = self.max
-
-        return infinity if max is None else max
-
     def is_closed(self) -> bool:
-        return self.is_left_closed() and self.is_right_closed()
+        return self.include_min and self.include_max
 
     def is_left_closed(self) -> bool:
         return self.include_min
@@ -442,16 +527,16 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
         return self.include_max
 
     def is_open(self) -> bool:
-        return self.is_left_open() and self.is_right_open()
+        return not self.include_min and not self.include_max
 
     def is_left_open(self) -> bool:
-        return self.exclude_min
+        return not self.include_min
 
     def is_right_open(self) -> bool:
-        return self.exclude_max
+        return not self.include_max
 
     def is_unbounded(self) -> bool:
-        return self.is_left_unbounded() and self.is_right_unbounded()
+        return self.min is None and self.max is None
 
     def is_left_unbounded(self) -> bool:
         return self.min is None
@@ -460,7 +545,7 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
         return self.max is None
 
     def is_bounded(self) -> bool:
-        return self.is_left_bounded() and self.is_right_bounded()
+        return self.min is not None and self.max is not None
 
     def is_left_bounded(self) -> bool:
         return self.min is not None
@@ -472,52 +557,17 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
         return self.comparable_min == self.comparable_max
 
     def is_lower(self, other: VersionRange) -> bool:
-        self_comparable_min = self.comparable_min
-        other_comparable_min = other.comparable_min
-
-        if self_comparable_min < other_comparable_min:
-            return True
-
-        if self_comparable_min > other_comparable_min:
-            return False
-
-        return self.include_min and other.exclude_min
+        return self.min_key < other.min_key
 
     def is_higher(self, other: VersionRange) -> bool:
-        self_comparable_max = self.comparable_max
-        other_comparable_max = other.comparable_max
-
-        if self_comparable_max < other_comparable_max:
-            return False
-
-        if self_comparable_max > other_comparable_max:
-            return True
-
-        return self.include_max and other.exclude_max
+        return self.max_key > other.max_key
 
     def is_strictly_lower(self, other: VersionRange) -> bool:
-        self_comparable_max = self.comparable_max
-        other_comparable_min = other.comparable_min
-
-        if self_comparable_max < other_comparable_min:
-            return True
-
-        if self_comparable_max > other_comparable_min:
-            return False
-
-        return self.exclude_max or other.exclude_min
+        # on equal bounds, only `v]` against `[v` overlap, giving `(v, 1) > (v, 0)`
+        return self.max_key <= other.min_key
 
     def is_strictly_higher(self, other: VersionRange) -> bool:
-        self_comparable_min = self.comparable_min
-        other_comparable_max = other.comparable_max
-
-        if self_comparable_min > other_comparable_max:
-            return True
-
-        if self_comparable_min < other_comparable_max:
-            return False
-
-        return self.exclude_min or other.exclude_max
+        return self.min_key >= other.max_key
 
     def is_left_adjacent(self, other: VersionRange) -> bool:
         return (self.max == other.min) and (self.include_max is other.exclude_min)
@@ -529,10 +579,21 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
         return self.is_left_adjacent(other) or self.is_right_adjacent(other)
 
     def __hash__(self) -> int:
-        return hash(self.parameters)
+        return self.hash_value
 
     def __eq__(self, other: Any) -> bool:
-        return is_version_range(other) and self.parameters == other.parameters
+        if self is other:
+            return True
+
+        if not is_version_range(other) or self.hash_value != other.hash_value:
+            return False
+
+        return (
+            self.min == other.min
+            and self.max == other.max
+            and self.include_min == other.include_min
+            and self.include_max == other.include_max
+        )
 
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
@@ -550,46 +611,36 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
         return self.compare(other).is_greater_or_equal()
 
     def compare(self, other: VersionRange) -> Ordering:
-        self_comparable_min = self.comparable_min
-        other_comparable_min = other.comparable_min
+        self_min_key = self.min_key
+        other_min_key = other.min_key
 
-        if self_comparable_min > other_comparable_min:
+        if self_min_key > other_min_key:
             return Ordering.GREATER
 
-        if self_comparable_min < other_comparable_min:
+        if self_min_key < other_min_key:
             return Ordering.LESS
 
-        include_min = self.include_min
-
-        if include_min == other.exclude_min:
-            return Ordering.LESS if include_min else Ordering.GREATER
-
-        self_comparable_max = self.comparable_max
-        other_comparable_max = other.comparable_max
+        self_max_key = self.max_key
+        other_max_key = other.max_key
 
-        if self_comparable_max > other_comparable_max:
+        if self_max_key > other_max_key:
             return Ordering.GREATER
 
-        if self_comparable_max < other_comparable_max:
+        if self_max_key < other_max_key:
             return Ordering.LESS
 
-        include_max = self.include_max
-
-        if include_max == other.exclude_max:
-            return Ordering.GREATER if include_max else Ordering.LESS
-
         return Ordering.EQUAL
 
     # protocol implementation
 
     def is_empty(self) -> bool:
-        return self.is_empty_or_point() and not self.is_closed()
+        return self.empty
 
     def is_point(self) -> bool:
-        return self.is_empty_or_point() and self.is_closed()
+        return self.point
 
     def is_universal(self) -> bool:
-        return self.is_unbounded()
+        return self.min is None and self.max is None
 
     @property
     def version(self) -> Version:
@@ -608,22 +659,9 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
         return version
 
     def contains(self, version: Version) -> bool:
-        comparable_min = self.comparable_min
-        comparable_max = self.comparable_max
-
-        if version < comparable_min:
-            return False
-
-        if self.exclude_min and version == comparable_min:
-            return False
-
-        if version > comparable_max:
-            return False
-
-        if self.exclude_max and version == comparable_max:
-            return False
+        sort_key = version.sort_key
 
-        return True
+        return self.min_key <= (sort_key, INCLUDED_MIN) and (sort_key, INCLUDED_MAX) <= self.max_key
 
     accepts = contains
 
@@ -638,7 +676,10 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
             return not version_set.is_lower(self) and not version_set.is_higher(self)
 
         if is_version_union(version_set):
-            return all(self.includes(item) for item in version_set.items)
+            # items are sorted and disjoint, so covering both ends covers everything in between
+            items = version_set.items
+
+            return self.includes(items[0]) and self.includes(items[-1])
 
         raise unexpected_version_set(version_set)
 
@@ -653,7 +694,11 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
             return self.intersects_range(version_set)
 
         if is_version_union(version_set):
-            return any(self.intersects(item) for item in version_set.items)
+            for item in version_set.candidate_items(self):
+                if self.intersects(item):
+                    return True
+
+            return False
 
         raise unexpected_version_set(version_set)
 
@@ -665,48 +710,39 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
             return EMPTY_SET
 
         if is_version_point(version_set):
-            return version_set.intersection(self)
+            return version_set if self.contains(version_set.version) else EMPTY_SET
 
         if is_version_range(version_set):
-            if self.is_lower(version_set):
-                if self.is_strictly_lower(version_set):
-                    return EMPTY_SET
+            intersection = self.intersection_item(version_set)
 
-                intersection_min = version_set.min
-                intersection_include_min = version_set.include_min
+            return EMPTY_SET if intersection is None else intersection
 
-            else:
-                if self.is_strictly_higher(version_set):
-                    return EMPTY_SET
+        if is_version_union(version_set):
+            return version_set.intersection(self)
 
-                intersection_min = self.min
-                intersection_include_min = self.include_min
+        raise unexpected_version_set(version_set)
 
-            if self.is_higher(version_set):
-                intersection_max = version_set.max
-                intersection_include_max = version_set.include_max
+    def intersection_item(self, item: VersionItem) -> Optional[VersionItem]:
+        # computed from the bounds alone, returning `None` instead of the empty set
+        self_min_key = self.min_key
+        self_max_key = self.max_key
 
-            else:
-                intersection_max = self.max
-                intersection_include_max = self.include_max
-
-            # if we reached here, there is an actual range
-            intersection = VersionRange(
-                intersection_min,
-                intersection_max,
-                intersection_include_min,
-                intersection_include_max,
-            )
+        item_min_key = item.min_key
+        item_max_key = item.max_key
 
-            if intersection.is_point():
-                return VersionPoint(intersection.version)
+        if self_max_key <= item_min_key or self_min_key >= item_max_key:
+            return None  # strictly lower or strictly higher
 
-            return intersection
+        lower = item if self_min_key < item_min_key else self
+        upper = item if self_max_key > item_max_key else self
 
-        if is_version_union(version_set):
-            return version_set.intersection(self)
+        # if we reached here, there is an actual range
+        intersection = VersionRange(lower.min, upper.max, lower.include_min, upper.include_max)
 
-        raise unexpected_version_set(version_set)
+        if intersection.is_point():
+            return VersionPoint(intersection.version)
+
+        return intersection
 
     def union(self, version_set: VersionSet) -> VersionSet:
         if is_version_empty(version_set):
@@ -719,10 +755,10 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
                 return self
 
             if version == self.min:
-                return evolve(self, include_min=True)
+                return VersionRange(self.min, self.max, True, self.include_max)
 
             if version == self.max:
-                return evolve(self, include_max=True)
+                return VersionRange(self.min, self.max, self.include_min, True)
 
             return VersionUnion.of(self, version_set)
 
@@ -730,28 +766,10 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
             if not self.is_adjacent(version_set) and not self.intersects(version_set):
                 return VersionUnion.of(self, version_set)
 
-            if self.is_lower(version_set):
-                union_min = self.min
-                union_include_min = self.include_min
-
-            else:
-                union_min = version_set.min
-                union_include_min = version_set.include_min
+            lower = self if self.min_key < version_set.min_key else version_set
+            upper = self if self.max_key > version_set.max_key else version_set
 
-            if self.is_higher(version_set):
-                union_max = self.max
-                union_include_max = self.include_max
-
-            else:
-                union_max = version_set.max
-                union_include_max = version_set.include_max
-
-            return VersionRange(
-                union_min,
-                union_max,
-                union_include_min,
-                union_include_max,
-            )
+            return VersionRange(lower.min, upper.max, lower.include_min, upper.include_max)
 
         if is_version_union(version_set):
             return version_set.union(self)
@@ -772,17 +790,20 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
                 if self.exclude_min:
                     return self
 
-                return evolve(self, include_min=False)
+                return VersionRange(self.min, self.max, False, self.include_max)
 
             if version == self.max:
                 if self.exclude_max:
                     return self
 
-                return evolve(self, include_max=False)
+                return VersionRange(self.min, self.max, self.include_min, False)
 
-            return VersionUnion.of(
-                evolve(self, max=version, include_max=False),
-                evolve(self, min=version, include_min=False),
+            # the pieces are sorted and separated by the excluded version
+            return VersionUnion.of_iterable_unchecked(
+                (
+                    VersionRange(self.min, version, self.include_min, False),
+                    VersionRange(version, self.max, False, self.include_max),
+                )
             )
 
         if is_version_range(version_set):
@@ -798,7 +819,9 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
                 before = VersionPoint(self.min)  # type: ignore
 
             else:
-                before = evolve(self, max=version_set.min, include_max=version_set.exclude_min)
+                before = VersionRange(
+                    self.min, version_set.min, self.include_min, version_set.exclude_min
+                )
 
             after: Optional[VersionItem]
 
@@ -809,7 +832,9 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
                 after = VersionPoint(self.max)  # type: ignore
 
             else:
-                after = evolve(self, min=version_set.max, include_min=version_set.exclude_max)
+                after = VersionRange(
+                    version_set.max, self.max, version_set.exclude_max, self.include_max
+                )
 
             if before is None:
                 if after is None:
@@ -823,17 +848,20 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
 
                 return before
 
-            return VersionUnion.of(before, after)
+            # the pieces are sorted and separated by the excluded range
+            return VersionUnion.of_iterable_unchecked((before, after))
 
         if is_version_union(version_set):
-            return VersionUnion.of_iterable(self.difference_iterator(version_set))
+            # the pieces are sorted and separated by the excluded items
+            return VersionUnion.of_items_unchecked(list(self.difference_iterator(version_set)))
 
         raise unexpected_version_set(version_set)
 
     def difference_iterator(self, version_union: VersionUnion) -> Iterator[VersionItem]:
         current: VersionItem = self
 
-        for item in version_union.items:
+        # only the items around this range can affect the difference
+        for item in version_union.candidate_items(self):
             if item.is_strictly_lower(current):
                 continue
 
@@ -847,77 +875,100 @@ class VersionRange(Representation, ToString, VersionSetProtocol):
 
                 yield item
 
-            if is_version_item(difference):
+            elif is_version_item(difference):
                 current = difference
 
+            else:  # nothing is left
+                return
+
         yield current
 
+    def symmetric_difference(self, version_set: VersionSet) -> VersionSet:
+        return VersionUnion.of(self.difference(version_set), version_set.difference(self))
+
     def complement(self) -> VersionSet:
         return UNIVERSAL_SET.difference(self)
 
-    def to_string_iterator(self) -> Iterator[str]:
-        if self.is_empty():
-            yield EMPTY_VERSION
-            return
-
-        if self.is_point():
-            yield self.version.to_string()
-            return
-
-        if self.is_universal():
-            yield UNIVERSE_VERSION
-            return
+    def bound_operators(self) -> List[Operator]:
+        operators: List[Operator] = []
 
         min = self.min
 
         if min is not None:
-            min_operator = (
+            operators.append(
                 Operator.greater_or_equal(min) if self.include_min else Operator.greater(min)
             )
 
-            yield min_operator.to_string()
-
         max = self.max
 
         if max is not None:
-            max_operator = Operator.less_or_equal(max) if self.include_max else Operator.less(max)
+            operators.append(
+                Operator.less_or_equal(max) if self.include_max else Operator.less(max)
+            )
+
+        return operators
 
-            yield max_operator.to_string()
+    def to_string_iterator(self) -> Iterator[str]:
+        if self.is_empty():
+            yield EMPTY_VERSION
+
+        elif self.is_point():
+            yield self.version.to_string()
+
+        elif self.is_universal():
+            yield UNIVERSE_VERSION
+
+        else:
+            for operator in self.bound_operators():
+                yield operator.to_string()
 
     def to_short_string_iterator(self) -> Iterator[str]:
         if self.is_empty():
             yield EMPTY_VERSION
-            return
 
-        if self.is_point():
+        elif self.is_point():
             yield self.version.to_short_string()
-            return
 
-        if self.is_universal():
+        elif self.is_universal():
             yield UNIVERSE_VERSION
-            return
 
-        min = self.min
+        else:
+            for operator in self.bound_operators():
+                yield operator.to_short_string()
 
-        if min is not None:
-            min_operator = (
-                Operator.greater_or_equal(min) if self.include_min else Operator.greater(min)
-            )
+    def to_string(self) -> str:
+        if self.is_empty():
+            return EMPTY_VERSION
 
-            yield min_operator.to_short_string()
+        if self.is_point():
+            return self.version.to_string()
 
-        max = self.max
+        if self.is_universal():
+            return UNIVERSE_VERSION
 
-        if max is not None:
-            max_operator = Operator.less_or_equal(max) if self.include_max else Operator.less(max)
+        return concat_comma_space([operator.to_string() for operator in self.bound_operators()])
 
-            yield max_operator.to_short_string()
+    def to_short_string(self) -> str:
+        if self.is_empty():
+            return EMPTY_VERSION
 
-    def to_string(self) -> str:
-        return concat_comma_space(self.to_string_iterator())
+        if self.is_point():
+            return self.version.to_short_string()
 
-    def to_short_string(self) -> str:
-        return concat_comma(self.to_short_string_iterator())
+        if self.is_universal():
+            return UNIVERSE_VERSION
+
+        return concat_comma([operator.to_short_string() for operator in self.bound_operators()])
+
+    # operators call the implementations directly
+
+    __contains__ = contains
+
+    __and__ = __iand__ = intersection
+    __or__ = __ior__ = union
+    __sub__ = __isub__ = difference
+    __xor__ = __ixor__ = symmetric_difference
+    __negate__ = __invert__ = complement
 
 
 UNIVERSAL_SET = VersionRange()
@@ -937,6 +988,17 @@ class VersionPoint(VersionRange):
     include_min: Literal[True] = field(default=True, init=False)
     include_max: Literal[True] = field(default=True, init=False)
 
+    comparable_min: Version = field(init=False, eq=False)
+    comparable_max: Version = field(init=False, eq=False)
+
+    min_key: BoundKey = field(init=False, eq=False)
+    max_key: BoundKey = field(init=False, eq=False)
+
+    empty: Literal[False] = field(default=False, init=False, eq=False)
+    point: Literal[True] = field(default=True, init=False, eq=False)
+
+    hash_value: int = field(init=False, eq=False)
+
     @min.default
     def default_min(self) -> Version:
         return self.version
@@ -945,6 +1007,26 @@ class VersionPoint(VersionRange):
     def default_max(self) -> Version:
         return self.version
 
+    @comparable_min.default
+    def default_comparable_min(self) -> Version:
+        return self.version
+
+    @comparable_max.default
+    def default_comparable_max(self) -> Version:
+        return self.version
+
+    @min_key.default
+    def default_min_key(self) -> BoundKey:
+        return (self.version.sort_key, INCLUDED_MIN)
+
+    @max_key.default
+    def default_max_key(self) -> BoundKey:
+        return (self.version.sort_key, INCLUDED_MAX)
+
+    @hash_value.default
+    def default_hash_value(self) -> int:
+        return hash(self.parameters)
+
     def is_empty(self) -> bool:
         return False
 
@@ -960,18 +1042,35 @@ class VersionPoint(VersionRange):
 
     accepts = contains
 
+    # points against points (for instance, pinned versions) skip the dispatch and compare versions
+
     def includes(self, version_set: VersionSet) -> bool:
+        if type(version_set) is VersionPoint:
+            return self.version == version_set.version
+
         return version_set.is_empty() or (
             is_version_point(version_set) and self.contains(version_set.version)
         )
 
     def intersects(self, version_set: VersionSet) -> bool:
+        if type(version_set) is VersionPoint:
+            return self.version == version_set.version
+
         return version_set.contains(self.version)
 
     def intersection(self, version_set: VersionSet) -> VersionSet:
+        if type(version_set) is VersionPoint:
+            return self if self.version == version_set.version else EMPTY_SET
+
         return self if version_set.contains(self.version) else EMPTY_SET
 
     def union(self, version_set: VersionSet) -> VersionSet:
+        if type(version_set) is VersionPoint:
+            if self.version == version_set.version:
+                return self
+
+            return VersionUnion.of(self, version_set)
+
         if is_version_empty(version_set):
             return self
 
@@ -990,10 +1089,18 @@ class VersionPoint(VersionRange):
         raise unexpected_version_set(version_set)
 
     def difference(self, version_set: VersionSet) -> VersionSet:
+        if type(version_set) is VersionPoint:
+            return EMPTY_SET if self.version == version_set.version else self
+
         return EMPTY_SET if version_set.contains(self.version) else self
 
     def complement(self) -> VersionSet:
-        return UNIVERSAL_SET.difference(self)
+        version = self.version
+
+        return VersionUnion.of_unchecked(
+            VersionRange(max=version, include_max=False),
+            VersionRange(min=version, include_min=False),
+        )
 
     def to_string(self) -> str:
         return self.version.to_string()
@@ -1001,6 +1108,15 @@ class VersionPoint(VersionRange):
     def to_short_string(self) -> str:
         return self.version.to_short_string()
 
+    # operators call the implementations directly (redefined to pick up the overrides)
+
+    __contains__ = contains
+
+    __and__ = __iand__ = intersection
+    __or__ = __ior__ = union
+    __sub__ = __isub__ = difference
+    __negate__ = __invert__ = complement
+
 
 NO_ITEMS = "expected at least 2 items, 0 found"
 ONE_ITEM = "expected at least 2 items, 1 found; consider using it directly"
@@ -1014,9 +1130,40 @@ def check_items(items: VersionItems) -> None:
         raise ValueError(ONE_ITEM)
 
 
+def gallop(keys: Sequence[BoundKey], key: BoundKey, low: int) -> int:
+    # find the first index from `low` onwards with a greater key, probing exponentially growing
+    # steps first so that advancing by a few items stays cheap while skipping many is logarithmic
+    length = len(keys)
+
+    high = low
+    step = 1
+
+    while high < length and keys[high] <= key:
+        low = high + 1
+        high += step
+        step <<= 1
+
+    return bisect_right(keys, key, low, min(high, length))
+
+
 UNEXPECTED_UNION = "the union of adjacent or intersecting ranges must be a range"
 
+EXCLUDE_VERSION_ITEMS = 2
+
+INCLUDES = "includes"
+INTERSECTION = "intersection"
+UNION = "union"
+DIFFERENCE = "difference"
+COMPLEMENT = "complement"
+
 U = TypeVar("U", bound="VersionUnion")
+R = TypeVar("R")
+
+OPERATION_CACHE_SIZE = 64
+
+OperationKey = Tuple[str, int]
+OperationEntry = Tuple["ref[VersionSet]", Any, bool]
+OperationCache = Dict[OperationKey, OperationEntry]
 
 
 @frozen(repr=False, order=False)
@@ -1025,10 +1172,110 @@ class VersionUnion(Representation, ToString, Specification):
 
     items: VersionItems = field()
 
+    max_keys: DynamicTuple[BoundKey] = field(init=False, repr=False, eq=False)
+
+    exclude_version: Optional[Version] = field(init=False, repr=False, eq=False)
+
+    operation_cache: OperationCache = field(factory=dict, init=False, repr=False, eq=False)
+
+    @max_keys.default
+    def default_max_keys(self) -> DynamicTuple[BoundKey]:
+        return tuple(item.max_key for item in self.items)
+
+    @exclude_version.default
+    def default_exclude_version(self) -> Optional[Version]:
+        # the complement is a point exactly when the union is `(ε, v) | (v, ω)`
+        items = self.items
+
+        if len(items) != EXCLUDE_VERSION_ITEMS:
+            return None
+
+        left, right = items
+
+        if left.min is None and right.max is None and left.exclude_max and right.exclude_min:
+            version = left.max
+
+            if version is not None and version == right.min:
+                return version
+
+        return None
+
     @items.validator
     def check_items(self, attribute: Attribute[VersionItems], items: VersionItems) -> None:
         check_items(items)
 
+    def cached_operation(
+        self,
+        name: str,
+        version_set: VersionSet,
+        operation: Callable[[VersionSet], R],
+        commutative: bool = False,
+    ) -> R:
+        # unions are immutable, so the result only depends on the operand
+        result = self.find_operation(name, version_set)
+
+        if result is None and commutative and is_version_union(version_set):
+            # the other union might have already computed the same operation against us
+            result = version_set.find_operation(name, self)
+
+        if result is None:
+            result = operation(version_set)
+
+            self.store_operation(name, version_set, result)
+
+        return cast(R, result)
+
+    def find_operation(self, name: str, version_set: VersionSet) -> Optional[Any]:
+        key = (name, id(version_set))
+
+        operation_cache = self.operation_cache
+
+        entry = operation_cache.pop(key, None)
+
+        if entry is None:
+            return None
+
+        reference, result, weak = entry
+
+        # the operand is referenced weakly, so its `id` might have been reused by another set
+        if reference() is not version_set:
+            return None
+
+        if weak:
+            result = result()
+
+            if result is None:
+                return None
+
+        operation_cache[key] = entry  # reinsert the entry to mark it as recently used
+
+        return result
+
+    def store_operation(self, name: str, version_set: VersionSet, result: Any) -> None:
+        operation_cache = self.operation_cache
+
+        if len(operation_cache) >= OPERATION_CACHE_SIZE:
+            # dictionaries preserve insertion order, so the first entry is the least recently used;
+            # unions are shared across threads, so other threads might evict concurrently
+            try:
+                operation_cache.pop(next(iter(operation_cache)), None)
+
+            except (RuntimeError, StopIteration):  # changed or emptied during iteration
+                pass
+
+        # results that are either of the sets are referenced weakly to avoid reference cycles
+        weak = result is self or result is version_set
+
+        operation_cache[name, id(version_set)] = (
+            ref(version_set),
+            ref(result) if weak else result,
+            weak,
+        )
+
+    def __reduce__(self) -> Tuple[Type[Self], Tuple[VersionItems]]:
+        # derived fields and the operation cache are recomputed instead of being pickled
+        return (type(self), (self.items,))
+
     @classmethod
     def of_unchecked(cls: Type[U], *items: VersionItem) -> U:
         return cls(items)
@@ -1037,6 +1284,17 @@ class VersionUnion(Representation, ToString, Specification):
     def of_iterable_unchecked(cls: Type[U], items: Iterable[VersionItem]) -> U:
         return cls(tuple(items))
 
+    @classmethod
+    def of_items_unchecked(cls, items: Sequence[VersionItem]) -> VersionSet:
+        # items are expected to be sorted, and to neither intersect nor touch each other
+        if not items:
+            return EMPTY_SET
+
+        if contains_only_item(items):
+            return items[0]
+
+        return cls.of_iterable_unchecked(items)
+
     @staticmethod
     def extract(version_set: VersionSet) -> Iterator[VersionItem]:
         if is_version_union(version_set):
@@ -1045,41 +1303,74 @@ class VersionUnion(Representation, ToString, Specification):
         if is_version_item(version_set):
             yield version_set
 
+    @staticmethod
+    def extract_sorted(version_set: VersionSet) -> VersionItems:
+        if is_version_union(version_set):
+            return version_set.items
+
+        if is_version_item(version_set):
+            return (version_set,)
+
+        return ()
+
+    @staticmethod
+    def extract_max_keys(version_set: VersionSet) -> DynamicTuple[BoundKey]:
+        if is_version_union(version_set):
+            return version_set.max_keys
+
+        if is_version_item(version_set):
+            return (version_set.max_key,)
+
+        return ()
+
     @classmethod
     def merge(cls, iterable: Iterable[VersionSet]) -> VersionSet:
-        extracted = list(flatten(map(cls.extract, iterable)))
+        runs: List[VersionItems] = []
 
-        if not extracted:
-            return EMPTY_SET
+        append_run = runs.append
 
-        if any(item.is_universal() for item in extracted):
-            return UNIVERSAL_SET
+        for version_set in iterable:
+            if is_version_union(version_set):
+                append_run(version_set.items)
 
-        extracted.sort()  # since ranges and points are ordered
+            elif is_version_item(version_set):
+                append_run((version_set,))
 
         merged: List[VersionItem] = []
 
-        for item in extracted:
-            if not merged:  # nothing to merge yet
-                merged.append(item)
+        append_merged = merged.append
 
-            else:
-                last_item = last(merged)
+        tail: Optional[VersionItem] = None
+
+        # union items are already sorted, so merging the runs is enough to order all items
+        for item in merge_sorted(*runs):
+            if item.is_universal():
+                return UNIVERSAL_SET
 
-                if last_item.intersects(item) or last_item.is_adjacent(item):
-                    result = last_item.union(item)
+            if tail is None:  # nothing to merge yet
+                tail = item
 
-                    if is_version_item(result):
-                        set_last(merged, result)
+            elif tail.intersects(item) or tail.is_adjacent(item):
+                result = tail.union(item)
 
-                    else:
-                        raise InternalError(UNEXPECTED_UNION)
+                if is_version_item(result):
+                    tail = result
 
                 else:
-                    merged.append(item)
+                    raise InternalError(UNEXPECTED_UNION)
+
+            else:
+                append_merged(tail)
+
+                tail = item
 
-        if contains_only_item(merged):
-            return first(merged)
+        if tail is None:
+            return EMPTY_SET
+
+        if not merged:
+            return tail
+
+        merged.append(tail)
 
         return cls.of_iterable_unchecked(merged)
 
@@ -1091,12 +1382,6 @@ class VersionUnion(Representation, ToString, Specification):
     def of_iterable(cls, version_sets: Iterable[VersionSet]) -> VersionSet:
         return cls.merge(version_sets)
 
-    @property
-    def exclude_version(self) -> Optional[Version]:
-        complement = self.complement()
-
-        return complement.version if is_version_point(complement) else None
-
     def is_empty(self) -> bool:
         return False
 
@@ -1104,76 +1389,202 @@ class VersionUnion(Representation, ToString, Specification):
         return False
 
     def contains(self, version: Version) -> bool:
-        return any(item.contains(version) for item in self.items)
+        sort_key = version.sort_key
+
+        # skip items that end before the version
+        index = bisect_left(self.max_keys, (sort_key, INCLUDED_MAX))
+
+        items = self.items
+
+        if index == len(items):
+            return False
+
+        # items are sorted and disjoint, so only the first remaining item can contain the version
+        return items[index].min_key <= (sort_key, INCLUDED_MIN)
 
     accepts = contains
 
+    def is_same(self, version_union: VersionUnion) -> bool:
+        self_items = self.items
+        items = version_union.items
+
+        return self_items is items or self_items == items
+
+    # items are sorted, so comparing the extreme items is enough to tell the unions apart
+
+    def is_strictly_lower(self, version_union: VersionUnion) -> bool:
+        return self.items[-1].is_strictly_lower(version_union.items[0])
+
+    def is_strictly_higher(self, version_union: VersionUnion) -> bool:
+        return self.items[0].is_strictly_higher(version_union.items[-1])
+
+    def candidate_items(self, version_item: VersionItem) -> Iterator[VersionItem]:
+        items = self.items
+
+        # items are sorted and disjoint, so skip the ones that end before the item starts
+        index = bisect_right(self.max_keys, version_item.min_key)
+
+        for index in range(index, len(items)):
+            item = items[index]
+
+            if item.is_strictly_higher(version_item):
+                break
+
+            yield item
+
     def includes(self, version_set: VersionSet) -> bool:
-        self_items = iter(self.items)
-        items = self.extract(version_set)
+        return self.cached_operation(INCLUDES, version_set, self.compute_includes)
 
-        self_item = next_or_none(self_items)
-        item = next_or_none(items)
+    def compute_includes(self, version_set: VersionSet) -> bool:
+        if type(version_set) is VersionPoint:
+            return self.contains(version_set.version)
 
-        while self_item and item:
-            if self_item.includes(item):
-                item = next_or_none(items)
+        self_items = self.items
+        self_max_keys = self.max_keys
 
-            else:
-                self_item = next_or_none(self_items)
+        self_length = len(self_items)
+
+        self_index = 0
 
-        return item is None  # all items are covered
+        for item in self.extract_sorted(version_set):
+            # only the first item that does not end before this one can include it
+            self_index = gallop(self_max_keys, item.min_key, self_index)
+
+            if self_index == self_length or not self_items[self_index].includes(item):
+                return False
+
+        return True  # all items are covered
 
     def intersects(self, version_set: VersionSet) -> bool:
-        self_items = iter(self.items)
-        items = self.extract(version_set)
+        if type(version_set) is VersionPoint:
+            return self.contains(version_set.version)
+
+        if is_version_item(version_set):
+            for item in self.candidate_items(version_set):
+                if item.intersects(version_set):
+                    return True
+
+            return False
+
+        self_items = self.items
+        items = self.extract_sorted(version_set)
 
-        self_item = next_or_none(self_items)
-        item = next_or_none(items)
+        self_max_keys = self.max_keys
+        max_keys = self.extract_max_keys(version_set)
+
+        self_length = len(self_items)
+        length = len(items)
+
+        self_index = index = 0
+
+        while self_index < self_length and index < length:
+            self_item = self_items[self_index]
+            item = items[index]
 
-        while self_item and item:
             if self_item.intersects(item):
                 return True
 
+            # skip the items that end before the other item starts
             if item.is_higher(self_item):
-                self_item = next_or_none(self_items)
+                self_index = gallop(self_max_keys, item.min_key, self_index + 1)
 
             else:
-                item = next_or_none(items)
+                index = gallop(max_keys, self_item.min_key, index + 1)
 
         return False  # none of the items are allowed
 
     def intersection_iterator(self, version_set: VersionSet) -> Iterator[VersionItem]:
-        self_items = iter(self.items)
-        items = self.extract(version_set)
+        self_items = self.items
+        items = self.extract_sorted(version_set)
+
+        self_max_keys = self.max_keys
+        max_keys = self.extract_max_keys(version_set)
+
+        self_length = len(self_items)
+        length = len(items)
 
-        self_item = next_or_none(self_items)
-        item = next_or_none(items)
+        self_index = index = 0
 
-        while self_item and item:
-            intersection = self_item.intersection(item)
+        while self_index < self_length and index < length:
+            self_item = self_items[self_index]
+            item = items[index]
 
-            if is_version_item(intersection):
+            intersection = self_item.intersection_item(item)
+
+            if intersection is not None:
                 yield intersection
 
+            # skip the items that end before the other item starts
             if item.is_higher(self_item):
-                self_item = next_or_none(self_items)
+                self_index = gallop(self_max_keys, item.min_key, self_index + 1)
 
             else:
-                item = next_or_none(items)
+                index = gallop(max_keys, self_item.min_key, index + 1)
 
     def intersection(self, version_set: VersionSet) -> VersionSet:
-        return self.of_iterable(self.intersection_iterator(version_set))
+        return self.cached_operation(
+            INTERSECTION, version_set, self.compute_intersection, commutative=True
+        )
+
+    def compute_intersection(self, version_set: VersionSet) -> VersionSet:
+        if type(version_set) is VersionPoint:
+            return version_set if self.contains(version_set.version) else EMPTY_SET
+
+        if is_version_item(version_set):
+            intersections = (
+                item.intersection_item(version_set) for item in self.candidate_items(version_set)
+            )
+
+            # intersections of disjoint items with one item remain disjoint
+            return self.of_items_unchecked(
+                [intersection for intersection in intersections if intersection is not None]
+            )
+
+        if is_version_union(version_set):
+            if self.is_same(version_set):
+                return self
+
+            if self.is_strictly_lower(version_set) or self.is_strictly_higher(version_set):
+                return EMPTY_SET
+
+        # pieces of sorted disjoint items are sorted and disjoint, so there is nothing to merge
+        return self.of_items_unchecked(list(self.intersection_iterator(version_set)))
 
     def union(self, version_set: VersionSet) -> VersionSet:
+        return self.cached_operation(UNION, version_set, self.compute_union, commutative=True)
+
+    def compute_union(self, version_set: VersionSet) -> VersionSet:
         return self.of(self, version_set)
 
     def difference(self, version_set: VersionSet) -> VersionSet:
-        items_difference = ItemsDifference(iter(self.items), self.extract(version_set))
-        return self.of_iterable(items_difference.compute())
+        return self.cached_operation(DIFFERENCE, version_set, self.compute_difference)
+
+    def compute_difference(self, version_set: VersionSet) -> VersionSet:
+        if is_version_union(version_set):
+            if self.is_same(version_set):
+                return EMPTY_SET
+
+            if self.is_strictly_lower(version_set) or self.is_strictly_higher(version_set):
+                return self
+
+        items_difference = ItemsDifference(self.items, self.extract_sorted(version_set))
+
+        return self.of_items_unchecked(items_difference.compute())
+
+    def symmetric_difference(self, version_set: VersionSet) -> VersionSet:
+        return self.of(self.difference(version_set), version_set.difference(self))
 
     def complement(self) -> VersionSet:
-        return UNIVERSAL_SET.difference(self)
+        # the complement is the difference between the universal set and this union
+        return self.cached_operation(COMPLEMENT, UNIVERSAL_SET, self.compute_complement)
+
+    def compute_complement(self, universal_set: VersionSet) -> VersionSet:
+        exclude_version = self.exclude_version
+
+        if exclude_version is not None:
+            return VersionPoint(exclude_version)
+
+        return universal_set.difference(self)
 
     def to_string(self) -> str:
         exclude_version = self.exclude_version
@@ -1183,7 +1594,7 @@ class VersionUnion(Representation, ToString, Specification):
 
             return operator.to_string()
 
-        return concat_pipes_spaced(item.to_string() for item in self.items)
+        return concat_pipes_spaced([item.to_string() for item in self.items])
 
     def to_short_string(self) -> str:
         exclude_version = self.exclude_version
@@ -1193,137 +1604,106 @@ class VersionUnion(Representation, ToString, Specification):
 
             return operator.to_short_string()
 
-        return concat_pipes(item.to_short_string() for item in self.items)
+        return concat_pipes([item.to_short_string() for item in self.items])
+
+    # operators call the implementations directly
 
+    __contains__ = contains
 
-ALREADY_PREPARED = "`prepare` must be called exactly once"
-NOT_PREPARED = "`prepare` must be called before computing"
+    __and__ = __iand__ = intersection
+    __or__ = __ior__ = union
+    __sub__ = __isub__ = difference
+    __xor__ = __ixor__ = symmetric_difference
+    __negate__ = __invert__ = complement
 
 
 @define()
 class ItemsDifference:
-    items: Iterator[VersionItem] = field(repr=False)
-    other_items: Iterator[VersionItem] = field(repr=False)
-
-    current: Optional[VersionItem] = field(default=None, init=False)
-    other_current: Optional[VersionItem] = field(default=None, init=False)
-
-    prepared: bool = field(default=False, init=False)
-
-    result: List[VersionItem] = field(factory=list, init=False)
-
-    def is_prepared(self) -> bool:
-        return self.prepared
-
-    def is_not_prepared(self) -> bool:
-        return not self.prepared
-
-    def check_prepared(self) -> None:
-        if self.is_not_prepared():
-            raise ValueError(NOT_PREPARED)
-
-    def check_not_prepared(self) -> None:
-        if self.is_prepared():
-            raise ValueError(ALREADY_PREPARED)
-
-    def next_other_current(self) -> bool:
-        self.other_current = next_or_none(self.other_items)
-
-        if self.other_current:  # if another item is available
-            return True  # continue iteration
+    items: VersionItems = field(repr=False)
+    other_items: VersionItems = field(repr=False)
 
-        # otherwise, append all remaining items to result
-
-        result = self.result
-        current = self.current
-
-        if current:
-            result.append(current)
+    def compute(self) -> List[VersionItem]:
+        items = self.items
+        other_items = self.other_items
 
-        for item in self.items:
-            result.append(item)
+        length = len(items)
+        other_length = len(other_items)
 
-        return False  # stop iteration
+        result: List[VersionItem] = []
 
-    def next_current(self, include_current: bool = True) -> bool:
-        current = self.current
+        append = result.append
 
-        if include_current and current:  # add current if needed
-            self.result.append(current)
+        if not length:
+            return result
 
-        current = next_or_none(self.items)
+        index = other_index = 0
 
-        if not current:  # if items are exhausted
-            return False  # stop iteration
+        current = items[index]
 
-        self.current = current
+        while other_index < other_length:
+            other_current = other_items[other_index]
 
-        return True  # continue iteration
+            if other_current.is_strictly_lower(current):
+                other_index += 1
 
-    def prepare(self) -> None:
-        self.check_not_prepared()
+                continue
 
-        self.current = next_or_none(self.items)
-        self.other_current = next_or_none(self.other_items)
+            if other_current.is_strictly_higher(current):
+                append(current)
 
-        self.prepared = True
+                index += 1
 
-    def step(self) -> bool:
-        self.check_prepared()
+                if index == length:  # items are exhausted
+                    return result
 
-        current = self.current
-        other_current = self.other_current
+                current = items[index]
 
-        if not current or not other_current:
-            return False
+                continue
 
-        if other_current.is_strictly_lower(current):
-            return self.next_other_current()
+            # if we reach here, current items are guaranteed to be overlapping
+            difference = current.difference(other_current)
 
-        if other_current.is_strictly_higher(current):
-            return self.next_current()
+            # differences of items are unions, empty sets or items (ranges and points)
+            difference_type = difference.__class__
 
-        # if we reach here, current items are guaranteed to be overlapping
-        difference = current.difference(other_current)
+            if difference_type is VersionUnion:  # one item is contained within another
+                left, current = difference.items  # type: ignore
 
-        if is_version_union(difference):  # one item is contained within another
-            left, right = difference.items
+                append(left)
 
-            self.result.append(left)
+                other_index += 1
 
-            self.current = right
+            elif difference_type is VersionEmpty:
+                index += 1
 
-            return self.next_other_current()
+                if index == length:  # items are exhausted
+                    return result
 
-        if is_version_empty(difference):
-            return self.next_current(include_current=False)
+                current = items[index]
 
-        if is_version_range(difference):
-            self.current = difference
+            else:
+                current = difference  # type: ignore
 
-            if difference.is_higher(other_current):  # apply last check in the step
-                return self.next_other_current()
+                if current.is_higher(other_current):
+                    other_index += 1
 
-            else:
-                return self.next_current()
+                else:
+                    append(current)
 
-        raise TypeError(UNEXPECTED_VERSION_SET.format(repr(difference)))
+                    index += 1
 
-    def loop(self) -> None:
-        # print("prepared", self)
+                    if index == length:  # items are exhausted
+                        return result
 
-        while self.step():
-            # print("step", self)
-            pass
+                    current = items[index]
 
-        # print("finished", self)
+        # other items are exhausted, so everything that is left is kept
 
-    def compute(self) -> List[VersionItem]:
-        self.prepare()
+        append(current)
 
-        self.loop()
+        result.extend(items[index + 1 :])
 
-        return self.result
+        return result
 
 
 VersionSet = Union[VersionEmpty, VersionPoint, VersionRange, VersionUnion]
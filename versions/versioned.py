@@ -1,6 +1,15 @@
-from typing import Any, Protocol, Type, TypeVar, overload, runtime_checkable
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Protocol,
+    Sequence,
+    Type,
+    TypeVar,
+    overload,
+    runtime_checkable,
+)
 
-from typing_aliases import is_instance
 from typing_extensions import TypeGuard
 
 from versions.functions import parse_version
@@ -10,6 +19,7 @@ __all__ = (
     "VERSION",
     "Versioned",
     "get_version",
+    "get_versions",
     "has_version",
     "is_versioned",
 )
@@ -37,7 +47,7 @@ def is_versioned(item: Any) -> TypeGuard[Versioned]:
     Returns:
         Whether the `item` implements the [`Versioned`][versions.versioned.Versioned] protocol.
     """
-    return is_instance(item, Versioned)
+    return hasattr(item, VERSION)
 
 
 has_version = is_versioned
@@ -69,3 +79,30 @@ def get_version(item: Versioned, version_type: Type[Version] = Version) -> Versi
         The version of `version_type` of the item.
     """
     return parse_version(item.__version__, version_type)
+
+
+@overload
+def get_versions(items: Iterable[Any]) -> List[Version]:
+    ...
+
+
+@overload
+def get_versions(items: Iterable[Any], version_type: Type[V]) -> List[V]:
+    ...
+
+
+def get_versions(items: Iterable[Any], version_type: Type[Version] = Version) -> Sequence[Version]:
+    """Fetches the `__version__` attributes of the versioned `items`,
+    parsing them into versions of `version_type`, skipping items that are not versioned.
+
+    Since parsing is cached, items sharing version strings only get parsed once.
+
+    Arguments:
+        items: The items to fetch the versions from.
+        version_type: The type of the versions to parse.
+
+    Returns:
+        The versions of `version_type` of the versioned items.
+    """
+    # lists are invariant, so the implementation returns a sequence to cover both overloads
+    return [parse_version(item.__version__, version_type) for item in items if is_versioned(item)]